@@ -1,7 +1,4 @@
 import streamlit as st
-import pandas as pd
-from src.analyzer import Analyzer
-from src.recommender import Recommender
 import os
 
 st.set_page_config(page_title="AU Trend Analyzer", layout="wide")
@@ -11,16 +8,59 @@ st.title("Autodesk University Trend Analyzer (2025 -> 2026)")
 # Sidebar - Controls
 st.sidebar.header("Filters")
 
-# Initialize Logic
-@st.cache_data
-def load_data():
-    if not os.path.exists("data/au_2025.json"):
+DATA_FILE = "data/au_2025.json"
+VIEWS = ["Class Data", "Trend Analysis", "Future Predictions"]
+CLASS_COLUMNS = ['title', 'summary', 'topics', 'industries', 'products', 'url']
+SORT_OPTIONS = {"Default": None, "Title": 'title', "Link": 'url'}
+PAGE_SIZES = [25, 50, 100]
+SUMMARY_CHARS = 160
+
+# Initialize Logic (built once per server process and shared across reruns/sessions)
+@st.cache_resource
+def load_analyzer():
+    if not os.path.exists(DATA_FILE):
         return None
-    return Analyzer("data/au_2025.json")
+    from src.analyzer import Analyzer
+    return Analyzer(DATA_FILE)
+
+@st.cache_resource
+def load_recommender():
+    from src.recommender import Recommender
+    return Recommender(load_analyzer())
+
+# Precomputed slices from `python -m src.cube build` (ignored if missing or stale)
+@st.cache_resource
+def load_cube():
+    from src.cube import cube_path, load_cube
+    return load_cube(cube_path(DATA_FILE), DATA_FILE)
 
-analyzer = load_data()
+# Per-selection results, so revisiting a view or selection is instant
+@st.cache_data
+def get_trends(topics, industries, products):
+    from src.cube import lookup, TREND_KEYS
+    cached = lookup(load_cube(), topics, industries, products)
+    if cached:
+        return {key: cached[key] for key in TREND_KEYS}
+    analyzer = load_analyzer()
+    return analyzer.summarize_trends(analyzer.filter_rows(topics, industries, products))
+
+@st.cache_data
+def get_themes(topics, industries, products):
+    from src.cube import lookup
+    cached = lookup(load_cube(), topics, industries, products)
+    if cached:
+        return cached['themes']
+    analyzer = load_analyzer()
+    return analyzer.get_key_themes(analyzer.filter_rows(topics, industries, products))
 
-if not analyzer or analyzer.df.empty:
+@st.cache_data
+def get_suggestions():
+    return load_recommender().suggest_future_topics()
+
+with st.spinner("Loading class data..."):
+    analyzer = load_analyzer()
+
+if not analyzer or analyzer.corpus.empty:
     st.error("No data found! Please run the scraper first (or use the sample data provided).")
     st.info("Check data/au_2025.json")
     st.stop()
@@ -30,33 +70,66 @@ all_topics = analyzer.get_all_topics()
 all_industries = analyzer.get_all_industries()
 all_products = analyzer.get_all_products()
 
-selected_topics = st.sidebar.multiselect("Filter by Topic", all_topics)
-selected_industries = st.sidebar.multiselect("Filter by Industry", all_industries)
-selected_products = st.sidebar.multiselect("Filter by Product", all_products)
+# Show how many classes each option would match given the other active filters
+counts = analyzer.facet_counts(st.session_state.get('topics'), st.session_state.get('industries'),
+                               st.session_state.get('products'))
+
+def with_count(facet):
+    return lambda value: f"{value} ({counts[facet].get(value, 0)})"
+
+selected_topics = st.sidebar.multiselect("Filter by Topic", all_topics, key='topics',
+                                         format_func=with_count('topics'))
+selected_industries = st.sidebar.multiselect("Filter by Industry", all_industries, key='industries',
+                                             format_func=with_count('industries'))
+selected_products = st.sidebar.multiselect("Filter by Product", all_products, key='products',
+                                           format_func=with_count('products'))
+selection = (tuple(selected_topics), tuple(selected_industries), tuple(selected_products))
 
 # Apply Filter
-filtered_df = analyzer.filter_classes(selected_topics, selected_industries, selected_products)
-st.sidebar.markdown(f"**Classes Found:** {len(filtered_df)}")
+filtered_rows = analyzer.filter_rows(*selection)
+st.sidebar.markdown(f"**Classes Found:** {len(filtered_rows)}")
 
-# Tabs
-tab1, tab2, tab3 = st.tabs(["Class Data", "Trend Analysis", "Future Predictions"])
+# Views - only the selected one is computed on each rerun
+view = st.radio("View", VIEWS, horizontal=True, label_visibility="collapsed")
 
-with tab1:
+def show_class_data():
     st.subheader("2025 Class List")
-    # Updated: Show Description, Reset Index to start from 1
-    display_df = filtered_df[['title', 'summary', 'topics', 'industries', 'products', 'url']].reset_index(drop=True)
-    display_df.index = display_df.index + 1
-    
+
+    # Only the visible page (with shortened descriptions) is sent to the browser
+    col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
+    sort_label = col1.selectbox("Sort by", list(SORT_OPTIONS))
+    ascending = col2.radio("Order", ["Ascending", "Descending"], horizontal=True) == "Ascending"
+    page_size = col3.selectbox("Rows per page", PAGE_SIZES)
+    page_count = max(1, -(-len(filtered_rows) // page_size))
+    page = col4.number_input(f"Page (of {page_count})", min_value=1, max_value=page_count, value=1)
+
+    display_df = analyzer.page_classes(filtered_rows, page, page_size, CLASS_COLUMNS,
+                                       sort_by=SORT_OPTIONS[sort_label], ascending=ascending,
+                                       summary_chars=SUMMARY_CHARS)
+    page_rows = display_df.index.to_list()
+    # Updated: Show Description, number rows from 1 across pages
+    display_df.index = range((page - 1) * page_size + 1, (page - 1) * page_size + len(display_df) + 1)
+
     st.dataframe(display_df, use_container_width=True,
                  column_config={
                      "url": st.column_config.LinkColumn("Link"),
                      "summary": st.column_config.TextColumn("Description", width="medium")
                  })
 
-with tab2:
+    # Full description on demand
+    if page_rows:
+        row = st.selectbox("Show full description", page_rows, index=None,
+                           format_func=lambda r: analyzer.corpus.titles[r], placeholder="Choose a class...")
+        if row is not None:
+            st.markdown(f"**{analyzer.corpus.titles[row]}**")
+            st.write(analyzer.corpus.summaries[row])
+
+def show_trend_analysis():
+    import pandas as pd
+
     st.subheader("Trend Analysis (Based on Selection)")
-    trends = analyzer.summarize_trends(filtered_df)
-    
+    trends = get_trends(*selection)
+
     # 1. Topic & Phrase Charts
     col1, col2 = st.columns(2)
     with col1:
@@ -76,34 +149,33 @@ with tab2:
             st.bar_chart(phrases_df.set_index('Phrase'))
         else:
             st.info("No phrase data available.")
-            
+
     # 2. Automated Theme Extraction
     st.markdown("---")
     st.markdown("### 💡 Key Themes & Insights")
     st.write("Automatically extracted patterns from class descriptions:")
-    
-    themes = analyzer.get_key_themes(filtered_df)
+
+    themes = get_themes(*selection)
     if themes:
         for i, theme in enumerate(themes):
             st.info(f"**{i+1}.** {theme}.")
     else:
         st.write("No distinct themes found for this selection.")
 
-with tab3:
+def show_future_predictions():
     st.subheader("2026 Strategic Research Directions")
     st.markdown("Identified by analyzing the alignment between **AU 2025 Content** and **Global Market Trends**.")
-    
-    recommender = Recommender(analyzer)
-    suggestions = recommender.suggest_future_topics()
-    
+
+    suggestions = get_suggestions()
+
     if not suggestions:
         st.warning("No trends detected. Try selecting 'All' in filters to see the broader picture.")
-    
+
     for item in suggestions:
         with st.expander(f"✨ {item['trend']} (Relevance Score: {item['score']})", expanded=True):
             st.markdown(f"**Insight:** {item['reason']}")
             st.success(f"**Prediction:** {item['prediction']}")
-            
+
             st.markdown("#### 🔭 Recommended Research Directions:")
             directions = item.get('guide', [])
             # Handle both list (new format) and dict (old format backup)
@@ -114,6 +186,13 @@ with tab3:
                  for k, v in directions.items():
                     st.markdown(f"- 🎯 {v}")
 
+if view == "Class Data":
+    show_class_data()
+elif view == "Trend Analysis":
+    show_trend_analysis()
+else:
+    show_future_predictions()
+
 # Footer
 st.sidebar.markdown("---")
 st.sidebar.info("Data source: Autodesk University 2025 Search")
@@ -1,88 +1,183 @@
-import pandas as pd
+import threading
+import numpy as np
 from collections import Counter
 import re
 from .utils import load_json
+from .corpus import Corpus, TAG_FACETS, popcount
+
+WORD_PATTERN = re.compile(r'\b[a-z]{3,}\b')
+
+# Words filtered out before building phrases in summarize_trends
+TREND_STOPWORDS = set(['the', 'and', 'to', 'of', 'in', 'a', 'for', 'with', 'on', 'is', 'how',
+                       'this', 'that', 'it', 'are', 'from', 'by', 'an', 'be', 'as', 'will', 'can', 'your', 'we',
+                       'at', 'or', 'you', 'use', 'using', 'used', 'not', 'but', 'all', 'into', 'their', 'our',
+                       'new', 'more', 'what', 'why', 'when', 'up', 'out', 'do', 'so', 'which',
+                       # Languages and generic terms to strict filter
+                       'english', 'deutsch', 'español', 'français', '한국어', '日本語', '简体中文',
+                       'português', 'italiano', 'russian', 'polish', 'turkish', 'czech', 'arabic'])
+
+# Boilerplate filtered out before building concepts in get_key_themes
+THEME_STOPWORDS = set(['the', 'and', 'to', 'of', 'in', 'a', 'for', 'with', 'on', 'is', 'how',
+                       'this', 'that', 'it', 'are', 'from', 'by', 'an', 'be', 'as', 'will', 'can', 'your', 'we',
+                       'class', 'session', 'learn', 'autodesk', 'university', 'software'])  # Add boilerplates
 
 class Analyzer:
-    def __init__(self, data_file="data/au_2025.json"):
-        self.data = load_json(data_file)
-        self.df = pd.DataFrame(self.data)
-        
-        if not self.df.empty:
-            # Check if tags column exists and is not all null
-            if 'tags' in self.df.columns:
-                # Ensure tags is a dict
-                self.df['tags'] = self.df['tags'].apply(lambda x: x if isinstance(x, dict) else {})
-                
-                self.df['topics'] = self.df['tags'].apply(lambda x: x.get('topics', []))
-                self.df['industries'] = self.df['tags'].apply(lambda x: x.get('industries', []))
-                self.df['products'] = self.df['tags'].apply(lambda x: x.get('products', []))
-            
-            # Combine all text for search
-            self.df['all_text'] = self.df['title'].fillna('') + " " + self.df['summary'].fillna('') + " " + \
-                                  self.df['key_learnings'].apply(lambda x: " ".join(x) if isinstance(x, list) else "")
+    def __init__(self, data_file="data/au_2025.json", parallel=None, workers=None):
+        """
+        parallel: True/False forces the multi-process map-reduce path on or off;
+        None picks it automatically for corpora of PARALLEL_MIN_ROWS or more.
+        """
+        self.corpus = Corpus(load_json(data_file))
+        self.parallel = parallel
+        self.workers = workers
+        self._runner = None
+        self._runner_lock = threading.Lock()
+
+    def __getstate__(self):
+        # The process pool and shared memory are per-process; rebuild on demand
+        state = self.__dict__.copy()
+        state['_runner'] = None
+        del state['_runner_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._runner_lock = threading.Lock()
+
+    def _use_parallel(self, rows):
+        if self.parallel is not None:
+            return self.parallel
+        from .parallel import should_parallelize
+        return should_parallelize(len(rows))
+
+    def _parallel(self):
+        # One Analyzer may be shared by several app sessions (threads); only
+        # one of them may start the pool and copy the corpus to shared memory
+        with self._runner_lock:
+            if self._runner is None:
+                from .parallel import ParallelRunner
+                self._runner = ParallelRunner(self.corpus, self.workers)
+            return self._runner
+
+    def close(self):
+        """Shuts down the worker pool used by the parallel path, if any."""
+        with self._runner_lock:
+            if self._runner is not None:
+                self._runner.close()
+                self._runner = None
+
+    @property
+    def df(self):
+        """DataFrame view of the whole corpus, materialized on demand."""
+        return self.corpus.to_frame()
 
     def get_all_topics(self):
-        if self.df.empty: return []
-        topics = set()
-        for t_list in self.df['topics']:
-            topics.update(t_list)
-        return sorted(list(topics))
+        return self.corpus.facets['topics'].sorted_values()
 
     def get_all_industries(self):
-        if self.df.empty: return []
-        industries = set()
-        for i_list in self.df['industries']:
-            industries.update(i_list)
-        return sorted(list(industries))
+        return self.corpus.facets['industries'].sorted_values()
 
     def get_all_products(self):
-        if self.df.empty: return []
-        products = set()
-        for p_list in self.df['products']:
-            products.update(p_list)
-        return sorted(list(products))
+        return self.corpus.facets['products'].sorted_values()
 
-    def filter_classes(self, selected_topics=None, selected_industries=None, selected_products=None):
-        if self.df.empty: return pd.DataFrame()
-        
-        mask = pd.Series([True] * len(self.df))
+    def _facet_mask(self, facet, selected):
+        lists = self.corpus.facets[facet]
+        hits = np.isin(lists.ids, lists.lookup(selected))
+        mask = np.zeros(len(self.corpus), dtype=bool)
+        mask[lists.owners()[hits]] = True
+        return mask
+
+    def filter_rows(self, selected_topics=None, selected_industries=None, selected_products=None):
+        """Corpus row numbers of the classes matching the selection."""
+        mask = np.ones(len(self.corpus), dtype=bool)
         
         if selected_topics:
-            mask &= self.df['topics'].apply(lambda x: any(t in selected_topics for t in x))
+            mask &= self._facet_mask('topics', selected_topics)
             
         if selected_industries:
-            mask &= self.df['industries'].apply(lambda x: any(i in selected_industries for i in x))
+            mask &= self._facet_mask('industries', selected_industries)
             
         if selected_products:
-            mask &= self.df['products'].apply(lambda x: any(p in selected_products for p in x))
+            mask &= self._facet_mask('products', selected_products)
             
-        return self.df[mask]
+        return np.flatnonzero(mask)
+
+    def facet_counts(self, selected_topics=None, selected_industries=None, selected_products=None):
+        """
+        Drill-down counts for the sidebar: for every value of each facet, the
+        number of classes that would match if it were selected, given the
+        selections in the other facets. Returns {facet: {value: count}}.
+        """
+        facets = self.corpus.facets
+        selected = dict(zip(TAG_FACETS, (selected_topics, selected_industries, selected_products)))
+        n_words = (len(self.corpus) + 63) // 64
+        masks = {facet: facets[facet].any_of(values) for facet, values in selected.items() if values}
+
+        counts = {}
+        for facet in TAG_FACETS:
+            mask = np.full(n_words, np.iinfo(np.uint64).max, dtype=np.uint64)
+            for other, other_mask in masks.items():
+                if other != facet:
+                    mask &= other_mask
+            per_value = popcount(facets[facet].bitsets() & mask)
+            counts[facet] = dict(zip(facets[facet].vocab, per_value.tolist()))
+        return counts
+
+    def filter_classes(self, selected_topics=None, selected_industries=None, selected_products=None):
+        if self.corpus.empty:
+            import pandas as pd
+            return pd.DataFrame()
+        return self.corpus.to_frame(self.filter_rows(selected_topics, selected_industries, selected_products))
+
+    def page_classes(self, rows, page=1, page_size=25, columns=None, sort_by=None, ascending=True,
+                     summary_chars=None):
+        """
+        Materializes one page of the given rows, projected to `columns`.
+        sort_by may be one of corpus.SORTABLE_COLUMNS (default: corpus order);
+        summaries are cut to `summary_chars` characters when given.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        if sort_by:
+            rows = rows[np.argsort(self.corpus.sort_rank(sort_by)[rows], kind='stable')]
+        if not ascending:
+            rows = rows[::-1]
+
+        start = (max(page, 1) - 1) * page_size
+        page_df = self.corpus.to_frame(rows[start:start + page_size], columns)
+        if summary_chars and 'summary' in page_df.columns:
+            page_df['summary'] = [s if len(s) <= summary_chars else s[:summary_chars].rstrip() + "…"
+                                  for s in page_df['summary']]
+        return page_df
+
+    def _rows(self, filtered_df=None):
+        """Corpus row numbers behind a frame returned by filter_classes (or the rows themselves)."""
+        if filtered_df is None:
+            return np.arange(len(self.corpus))
+        if isinstance(filtered_df, np.ndarray):
+            return filtered_df.astype(np.int64, copy=False)
+        import pandas as pd
+        if isinstance(filtered_df, pd.DataFrame):
+            return filtered_df.index.to_numpy(dtype=np.int64)
+        return np.asarray(filtered_df, dtype=np.int64)
 
     def summarize_trends(self, filtered_df=None):
         """Extracts top topics and common phrases from the summary and learnings."""
-        df = filtered_df if filtered_df is not None else self.df
-        if df.empty: return {}
+        rows = self._rows(filtered_df)
+        if len(rows) == 0: return {}
+        if self._use_parallel(rows): return self._parallel().summarize_trends(rows)
+        corpus = self.corpus
         
         # 1. Top Topics
-        all_topics = []
-        for t_list in df['topics']:
-            all_topics.extend(t_list)
-        topic_counts = Counter(all_topics).most_common(15)
+        topics = corpus.facets['topics']
+        topic_counts = [(topics.vocab[t], c) for t, c in Counter(topics.gather(rows).tolist()).most_common(15)]
         
         # 2. Key Phrases (Bigrams & Trigrams)
         # Use only specific text fields, avoiding 'key_learnings' which often has languages list
-        text_corpus = " ".join(df['title'].fillna('') + " " + df['summary'].fillna('')).lower()
+        text_corpus = " ".join(corpus.titles[i] + " " + corpus.summaries[i] for i in rows).lower()
         
-        stopwords = set(['the', 'and', 'to', 'of', 'in', 'a', 'for', 'with', 'on', 'is', 'how', 
-                        'this', 'that', 'it', 'are', 'from', 'by', 'an', 'be', 'as', 'will', 'can', 'your', 'we',
-                        'at', 'or', 'you', 'use', 'using', 'used', 'not', 'but', 'all', 'into', 'their', 'our',
-                        'new', 'more', 'what', 'why', 'when', 'up', 'out', 'do', 'so', 'which',
-                        # Languages and generic terms to strict filter
-                        'english', 'deutsch', 'español', 'français', '한국어', '日本語', '简体中文',
-                        'português', 'italiano', 'russian', 'polish', 'turkish', 'czech', 'arabic'])
+        stopwords = TREND_STOPWORDS
         
-        words = re.findall(r'\b[a-z]{3,}\b', text_corpus)
+        words = WORD_PATTERN.findall(text_corpus)
         # Filter words first
         clean_words = [w for w in words if w not in stopwords]
         
@@ -115,27 +210,36 @@ class Analyzer:
         Extracts 'NotebookLM-style' insights by identifying key concepts (n-grams)
         and finding the most descriptive context sentences for them.
         """
-        df = filtered_df if filtered_df is not None else self.df
-        if df.empty: return []
+        rows = self._rows(filtered_df)
+        if len(rows) == 0: return []
+        summaries = [self.corpus.summaries[i] for i in rows]
 
         # 1. Identify Key Concepts (Frequent Trigrams/Quadgrams)
-        text_corpus = " ".join(df['summary'].fillna('')).lower()
-        stopwords = set(['the', 'and', 'to', 'of', 'in', 'a', 'for', 'with', 'on', 'is', 'how', 
-                        'this', 'that', 'it', 'are', 'from', 'by', 'an', 'be', 'as', 'will', 'can', 'your', 'we',
-                        'class', 'session', 'learn', 'autodesk', 'university', 'software']) # Add boilerplates
-        
-        words = re.findall(r'\b[a-z]{3,}\b', text_corpus)
-        clean_words = [w for w in words if w not in stopwords]
-        
-        # Build n-grams
-        ngrams = [] 
-        for i in range(len(clean_words)-3):
-            # Form 3-word phrases (e.g., "automated decision making", "reduce carbon emissions")
-            phrase = f"{clean_words[i]} {clean_words[i+1]} {clean_words[i+2]}"
-            ngrams.append(phrase)
+        if self._use_parallel(rows):
+            concept_counts = self._parallel().theme_concepts(rows)
+        else:
+            text_corpus = " ".join(summaries).lower()
+            stopwords = THEME_STOPWORDS
             
-        concept_counts = Counter(ngrams).most_common(20)
-        
+            words = WORD_PATTERN.findall(text_corpus)
+            clean_words = [w for w in words if w not in stopwords]
+            
+            # Build n-grams
+            ngrams = [] 
+            for i in range(len(clean_words)-3):
+                # Form 3-word phrases (e.g., "automated decision making", "reduce carbon emissions")
+                phrase = f"{clean_words[i]} {clean_words[i+1]} {clean_words[i+2]}"
+                ngrams.append(phrase)
+                
+            concept_counts = Counter(ngrams).most_common(20)
+
+        return self.insights_for_concepts(concept_counts, summaries)
+
+    def insights_for_concepts(self, concept_counts, summaries):
+        """
+        Step 2 of get_key_themes: a descriptive context sentence for each of
+        the given (concept, count) pairs, found in `summaries`.
+        """
         insights = []
         seen_sentences = set()
         
@@ -147,7 +251,7 @@ class Analyzer:
             max_quality = 0
             
             # Scan summaries
-            for summary in df['summary'].dropna():
+            for summary in summaries:
                 if concept not in summary.lower(): continue
                 
                 # Split and find the sentence with the concept
@@ -200,12 +304,15 @@ class Analyzer:
         Analyzes which topics frequently appear together.
         Returns: { 'Topic A': [('Co-occurring Topic B', count), ...] }
         """
-        df = filtered_df if filtered_df is not None else self.df
-        if df.empty: return {}
+        rows = self._rows(filtered_df)
+        if len(rows) == 0: return {}
+        if self._use_parallel(rows): return self._parallel().topic_intersections(rows)
+        topic_lists = self.corpus.facets['topics']
 
         co_occurrences = {}
         
-        for topics in df['topics']:
+        for row in rows:
+            topics = topic_lists.row(row)
             # Create combinations
             for i in range(len(topics)):
                 t1 = topics[i]
@@ -0,0 +1,69 @@
+import argparse
+import os
+import tempfile
+import time
+from .analyzer import Analyzer
+from .utils import load_json, save_json
+
+SIZES = [1000, 2500, 5000, 10000, 20000, 40000]
+
+def best_of(repeat, action):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        action()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def analysis_pass(analyzer):
+    # What a Trend Analysis view needs for one selection
+    analyzer.summarize_trends()
+    analyzer.get_key_themes()
+    analyzer.get_topic_intersections()
+
+def run_benchmark(data_file="data/au_2025.json", sizes=SIZES, workers=None, repeat=3):
+    """
+    Times the serial and the process-pool paths over corpora of `sizes` rows
+    (the dataset repeated). The pool is started before timing, as it is
+    reused by every later query. Returns (rows, serial s, parallel s, startup s).
+    """
+    records = load_json(data_file)
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            path = os.path.join(tmp, f"classes_{size}.json")
+            save_json([records[i % len(records)] for i in range(size)], path)
+            serial = Analyzer(path, parallel=False)
+            parallel = Analyzer(path, parallel=True, workers=workers)
+            try:
+                start = time.perf_counter()
+                parallel.summarize_trends()
+                startup = time.perf_counter() - start
+                results.append((size, best_of(repeat, lambda: analysis_pass(serial)),
+                                best_of(repeat, lambda: analysis_pass(parallel)), startup))
+            finally:
+                parallel.close()
+    return results
+
+def crossover(results):
+    """Smallest measured size from which the parallel path is faster, or None."""
+    for i, (size, _, _, _) in enumerate(results):
+        if all(p < s for _, s, p, _ in results[i:]):
+            return size
+    return None
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Find the corpus size where the parallel Analyzer path wins.")
+    parser.add_argument('--data', default="data/au_2025.json")
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES)
+    parser.add_argument('--workers', type=int, default=None, help="Pool size (default: all cores)")
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.data, args.sizes, args.workers, args.repeat)
+    print(f"{os.cpu_count()} cores, {args.workers or os.cpu_count()} workers")
+    print(f"{'rows':>8} {'serial ms':>10} {'parallel ms':>12} {'speedup':>8} {'first call ms':>14}")
+    for size, serial, parallel, startup in results:
+        print(f"{size:>8} {serial * 1000:>10.1f} {parallel * 1000:>12.1f} {serial / parallel:>7.2f}x {startup * 1000:>14.1f}")
+    size = crossover(results)
+    print(f"Parallel wins from {size} rows" if size else "Parallel never won in the measured range")
@@ -0,0 +1,32 @@
+import argparse
+import os
+import time
+from streamlit.testing.v1 import AppTest
+
+APP_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+def timed(label, action, results):
+    start = time.perf_counter()
+    at = action()
+    elapsed = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(f"{label} failed: {at.exception}")
+    results.append((label, elapsed))
+    return at
+
+def run_benchmark(topic="Software Development"):
+    """Times the first script run and typical interactions of app.py in a headless session."""
+    results = []
+    at = timed("first paint (cold start)", lambda: AppTest.from_file(APP_FILE, default_timeout=120).run(), results)
+    at = timed("filter change", lambda: at.sidebar.multiselect[0].select(topic).run(), results)
+    at = timed("filter cleared", lambda: at.sidebar.multiselect[0].unselect(topic).run(), results)
+    for view in ["Trend Analysis", "Future Predictions", "Trend Analysis", "Class Data"]:
+        at = timed(f"switch to {view}", lambda: at.radio[0].set_value(view).run(), results)
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark app.py startup and interaction latency.")
+    parser.add_argument('--topic', default="Software Development")
+    args = parser.parse_args()
+    for label, elapsed in run_benchmark(args.topic):
+        print(f"{label:<32} {elapsed * 1000:8.1f} ms")
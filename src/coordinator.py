@@ -0,0 +1,270 @@
+import asyncio
+import argparse
+import functools
+import json
+import multiprocessing
+import os
+import sqlite3
+import time
+from .utils import setup_logger, load_json, save_json
+
+logger = setup_logger('coordinator')
+
+STATE_FILE = "data/scrape_state.db"
+OUTPUT_FILE = "data/au_2025.json"
+MAX_ATTEMPTS = 3
+# A running listing with no checkpoint for this long is treated as abandoned
+STALE_SECONDS = 600
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS listings (
+    url TEXT PRIMARY KEY,
+    status TEXT NOT NULL DEFAULT 'pending',   -- pending | running | done | failed
+    pages_done INTEGER NOT NULL DEFAULT 0,
+    owner TEXT,
+    updated REAL
+);
+CREATE TABLE IF NOT EXISTS details (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    url TEXT UNIQUE NOT NULL,
+    title TEXT,
+    title_key TEXT UNIQUE,
+    status TEXT NOT NULL DEFAULT 'pending',   -- pending | running | done | failed | exported
+    attempts INTEGER NOT NULL DEFAULT 0,
+    owner TEXT,
+    result TEXT,
+    updated REAL
+);
+"""
+
+
+class WorkQueue:
+    """
+    Persistent scrape work queue and checkpoint store (SQLite, safe to share
+    between browser processes). Listing pages record how far they got and
+    every finished class page is stored as soon as it completes, so a
+    crashed run resumes where it stopped.
+    """
+    def __init__(self, path=STATE_FILE):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.db = sqlite3.connect(path, timeout=60, isolation_level=None)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def _claim(self, table, owner, where="status = 'pending'", params=()):
+        self.db.execute("BEGIN IMMEDIATE")
+        try:
+            row = self.db.execute(f"SELECT * FROM {table} WHERE {where} ORDER BY rowid LIMIT 1", params).fetchone()
+            if row is not None:
+                self.db.execute(f"UPDATE {table} SET status = 'running', owner = ?, updated = ? WHERE url = ?",
+                                (owner, time.time(), row['url']))
+            self.db.execute("COMMIT")
+            return row
+        except:
+            self.db.execute("ROLLBACK")
+            raise
+
+    # Listings
+    def add_listings(self, urls):
+        self.db.executemany("INSERT OR IGNORE INTO listings (url) VALUES (?)", [(u,) for u in urls])
+
+    def claim_listing(self, owner):
+        """Returns (url, pages_done) of a listing to work on, or None."""
+        row = self._claim('listings', owner, "status = 'pending' OR (status = 'running' AND updated < ?)",
+                          (time.time() - STALE_SECONDS,))
+        return (row['url'], row['pages_done']) if row else None
+
+    def listing_page_done(self, url, page_num, links, skip_urls=(), skip_titles=()):
+        """Checkpoints one listing page and queues its classes (deduplicated)."""
+        rows = []
+        for link in links:
+            title_key = link['title'].strip().lower()
+            # Same rules as scrape_all: known URL, known title, or a repeat session
+            if link['url'] in skip_urls or title_key in skip_titles or "repeat" in title_key:
+                continue
+            rows.append((link['url'], link['title'], title_key))
+        self.db.execute("BEGIN IMMEDIATE")
+        try:
+            self.db.executemany("INSERT OR IGNORE INTO details (url, title, title_key) VALUES (?, ?, ?)", rows)
+            # MAX: a resume that could not skip as far as the checkpoint must not move it back
+            self.db.execute("UPDATE listings SET pages_done = MAX(pages_done, ?), updated = ? WHERE url = ?",
+                            (page_num, time.time(), url))
+            self.db.execute("COMMIT")
+        except:
+            self.db.execute("ROLLBACK")
+            raise
+
+    def touch_listing(self, url):
+        """Keeps a running listing from going stale while its pages are skipped."""
+        self.db.execute("UPDATE listings SET updated = ? WHERE url = ?", (time.time(), url))
+
+    def finish_listing(self, url, status='done'):
+        self.db.execute("UPDATE listings SET status = ?, updated = ? WHERE url = ?", (status, time.time(), url))
+
+    # Class pages
+    def claim_details(self, owner, limit):
+        items = []
+        for _ in range(limit):
+            row = self._claim('details', owner)
+            if row is None:
+                break
+            items.append({'url': row['url'], 'title': row['title']})
+        return items
+
+    def detail_done(self, data):
+        if data.get('error'):
+            self.db.execute("""UPDATE details SET attempts = attempts + 1, updated = ?,
+                               status = CASE WHEN attempts + 1 >= ? THEN 'failed' ELSE 'pending' END
+                               WHERE url = ?""", (time.time(), MAX_ATTEMPTS, data['url']))
+        else:
+            self.db.execute("UPDATE details SET status = 'done', result = ?, updated = ? WHERE url = ?",
+                            (json.dumps(data, ensure_ascii=False), time.time(), data['url']))
+
+    # Coordination
+    def requeue_running(self):
+        """Returns work claimed by a crashed run (and failed listings) to the queue."""
+        self.db.execute("UPDATE listings SET status = 'pending', owner = NULL WHERE status IN ('running', 'failed')")
+        self.db.execute("UPDATE details SET status = 'pending', owner = NULL WHERE status = 'running'")
+
+    def listings_open(self):
+        """Listings that may still add class pages to the queue."""
+        return self.db.execute("SELECT COUNT(*) FROM listings WHERE status = 'pending' OR (status = 'running' AND updated >= ?)",
+                               (time.time() - STALE_SECONDS,)).fetchone()[0]
+
+    def counts(self):
+        counts = {}
+        for table in ('listings', 'details'):
+            for status, n in self.db.execute(f"SELECT status, COUNT(*) FROM {table} GROUP BY status"):
+                counts[f"{table}_{status}"] = n
+        return counts
+
+    def export(self, output_file=OUTPUT_FILE):
+        """
+        Appends finished class pages to the dataset and marks them exported.
+        The new dataset is written to a temp file and swapped in just before
+        the status change commits; on any earlier failure both the dataset and
+        the queue are left unchanged.
+        """
+        tmp_file = output_file + ".tmp"
+        self.db.execute("BEGIN IMMEDIATE")
+        try:
+            rows = self.db.execute("SELECT id, result FROM details WHERE status = 'done' ORDER BY id").fetchall()
+            if rows:
+                results = [json.loads(r['result']) for r in rows]
+                save_json(load_json(output_file) + results, tmp_file)
+                self.db.executemany("UPDATE details SET status = 'exported', result = NULL WHERE id = ?",
+                                    [(r['id'],) for r in rows])
+                os.replace(tmp_file, output_file)
+            self.db.execute("COMMIT")
+            return len(rows)
+        except:
+            self.db.execute("ROLLBACK")
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            raise
+
+
+async def scrape_listing(queue, owner, url, pages_done, list_pages, skip_urls=(), skip_titles=()):
+    """
+    Scrapes a claimed listing from the page after its last checkpoint.
+    list_pages(url, start_page, on_page, on_skip) is scraper.get_class_list
+    bound to a browser page.
+    """
+    logger.info(f"[{owner}] Listing {url} from page {pages_done + 1}")
+    try:
+        await list_pages(url, start_page=pages_done + 1,
+                         on_page=lambda n, links: queue.listing_page_done(url, n, links, skip_urls, skip_titles),
+                         on_skip=lambda n: queue.touch_listing(url))
+        queue.finish_listing(url)
+    except Exception as e:
+        logger.error(f"[{owner}] Listing {url} failed: {e}")
+        queue.finish_listing(url, 'failed')
+
+async def browser_worker(state_file, owner, output_file, headless=True, batch_size=5):
+    """One browser process: drains listing shards first, then class pages."""
+    from playwright.async_api import async_playwright
+    from .scraper import launch_browser, get_class_list, get_class_details
+
+    queue = WorkQueue(state_file)
+    existing = load_json(output_file)
+    skip_urls = set(item.get('url', '') for item in existing)
+    skip_titles = set(item.get('title', '').strip().lower() for item in existing)
+    del existing
+
+    async with async_playwright() as p:
+        browser, context = await launch_browser(p, headless=headless)
+        try:
+            while True:
+                listing = queue.claim_listing(owner)
+                if listing:
+                    page = await context.new_page()
+                    try:
+                        await scrape_listing(queue, owner, *listing, functools.partial(get_class_list, page),
+                                             skip_urls, skip_titles)
+                    finally:
+                        await page.close()
+                    continue
+
+                batch = queue.claim_details(owner, batch_size)
+                if batch:
+                    for data in await asyncio.gather(*(get_class_details(context, item) for item in batch)):
+                        queue.detail_done(data)
+                    logger.info(f"[{owner}] Progress: {queue.counts()}")
+                    continue
+
+                # Nothing pending; other workers may still be adding pages from listings
+                if queue.listings_open() == 0:
+                    break
+                await asyncio.sleep(5)
+        finally:
+            await browser.close()
+            queue.close()
+
+def _run_worker(state_file, owner, output_file, headless):
+    asyncio.run(browser_worker(state_file, owner, output_file, headless))
+
+
+def run(topics, years, workers=2, state_file=STATE_FILE, output_file=OUTPUT_FILE, headless=True, reset=False):
+    """
+    Shards listing pages (one listing per year/topic) and class pages across
+    `workers` browser processes, then exports the new classes. Re-running
+    with the same state file resumes an interrupted scrape.
+    """
+    from .scraper import listing_url
+
+    if reset and os.path.exists(state_file):
+        os.remove(state_file)
+    queue = WorkQueue(state_file)
+    queue.requeue_running()
+    queue.add_listings([listing_url(year, topic) for year in years for topic in topics])
+    logger.info(f"Queue state: {queue.counts()}")
+
+    processes = [multiprocessing.Process(target=_run_worker, args=(state_file, f"worker-{i}", output_file, headless))
+                 for i in range(workers)]
+    for proc in processes:
+        proc.start()
+    for proc in processes:
+        proc.join()
+
+    exported = queue.export(output_file)
+    logger.info(f"Exported {exported} new classes to {output_file}. Queue state: {queue.counts()}")
+    queue.close()
+    return exported
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scrape AU classes with several browsers and resumable checkpoints.")
+    parser.add_argument('--topic', action='append', help="Topic facet to list (repeatable, default: Software Development)")
+    parser.add_argument('--year', action='append', type=int, help="Year facet to list (repeatable, default: 2025)")
+    parser.add_argument('--workers', type=int, default=max(1, (os.cpu_count() or 2) // 2))
+    parser.add_argument('--state', default=STATE_FILE)
+    parser.add_argument('--output', default=OUTPUT_FILE)
+    parser.add_argument('--headful', action='store_true', help="Show browser windows")
+    parser.add_argument('--reset', action='store_true', help="Discard saved progress and start over")
+    args = parser.parse_args()
+    run(args.topic or ["Software Development"], args.year or [2025], args.workers,
+        args.state, args.output, headless=not args.headful, reset=args.reset)
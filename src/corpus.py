@@ -0,0 +1,204 @@
+import sys
+import numpy as np
+
+TAG_FACETS = ('topics', 'industries', 'products')
+DEFAULT_COLUMNS = ['url', 'title', 'summary', 'key_learnings', 'speakers', 'topics', 'industries', 'products']
+SORTABLE_COLUMNS = ('title', 'url')
+
+
+class InternedLists:
+    """
+    A column of string lists stored as integer IDs into a shared vocabulary.
+    Row i owns ids[offsets[i]:offsets[i+1]].
+    """
+    def __init__(self, lists):
+        self.vocab = []
+        self.index = {}
+        ids = []
+        offsets = [0]
+        for values in lists:
+            for v in values:
+                vid = self.index.get(v)
+                if vid is None:
+                    vid = len(self.vocab)
+                    v = sys.intern(v)
+                    self.vocab.append(v)
+                    self.index[v] = vid
+                ids.append(vid)
+            offsets.append(len(ids))
+        self.ids = np.array(ids, dtype=np.int32)
+        self.offsets = np.array(offsets, dtype=np.int64)
+        self._bits = None
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def lengths(self):
+        return np.diff(self.offsets)
+
+    def owners(self):
+        """Row number of every entry in `ids`."""
+        return np.repeat(np.arange(len(self), dtype=np.int64), self.lengths())
+
+    def row_ids(self, i):
+        return self.ids[self.offsets[i]:self.offsets[i + 1]]
+
+    def row(self, i):
+        return [self.vocab[v] for v in self.row_ids(i)]
+
+    def take(self, rows):
+        return [self.row(i) for i in rows]
+
+    def gather(self, rows):
+        """Concatenated ids of the given rows, in row order."""
+        rows = np.asarray(rows, dtype=np.int64)
+        starts = self.offsets[rows]
+        lens = self.offsets[rows + 1] - starts
+        if lens.sum() == 0:
+            return self.ids[:0]
+        shift = np.repeat(starts - np.concatenate(([0], np.cumsum(lens)[:-1])), lens)
+        return self.ids[shift + np.arange(lens.sum())]
+
+    def lookup(self, values):
+        """IDs for the given strings, ignoring values not in the vocabulary."""
+        return np.array([self.index[v] for v in values if v in self.index], dtype=np.int32)
+
+    def sorted_values(self):
+        return sorted(self.vocab)
+
+    def bitsets(self):
+        """
+        One row bitset per vocabulary value, as a (values, words) uint64 matrix:
+        bit r of row v is set when corpus row r contains value v.
+        """
+        if self._bits is None:
+            n_words = (len(self) + 63) // 64
+            matrix = np.zeros((len(self.vocab), n_words * 64), dtype=bool)
+            matrix[self.ids, self.owners()] = True
+            self._bits = np.packbits(matrix, axis=1, bitorder='little').view(np.uint64)
+        return self._bits
+
+    def any_of(self, values):
+        """Bitset of the rows containing any of the given values."""
+        ids = self.lookup(values)
+        if len(ids) == 0:
+            return np.zeros(self.bitsets().shape[1], dtype=np.uint64)
+        return np.bitwise_or.reduce(self.bitsets()[ids], axis=0)
+
+
+class Corpus:
+    """
+    Compact in-memory representation of the scraped class records.
+
+    Free text (url, title, summary) is kept once per row as plain strings,
+    list fields (tags, key learnings, speakers) are interned into ID arrays,
+    and derived strings such as the combined search text are built on demand.
+    """
+    def __init__(self, records):
+        self.urls = []
+        self.titles = []
+        self.summaries = []
+        learnings = []
+        speakers = []
+        tags = {facet: [] for facet in TAG_FACETS}
+
+        for item in records:
+            self.urls.append(_text(item.get('url')))
+            self.titles.append(_text(item.get('title')))
+            self.summaries.append(_text(item.get('summary')))
+            learnings.append(_string_list(item.get('key_learnings')))
+            speakers.append(_string_list(item.get('speakers')))
+            item_tags = item.get('tags')
+            if not isinstance(item_tags, dict):
+                item_tags = {}
+            for facet in TAG_FACETS:
+                tags[facet].append(_string_list(item_tags.get(facet)))
+
+        self.key_learnings = InternedLists(learnings)
+        self.speakers = InternedLists(speakers)
+        self.facets = {facet: InternedLists(tags[facet]) for facet in TAG_FACETS}
+        self._ranks = {}
+
+    def __len__(self):
+        return len(self.titles)
+
+    @property
+    def empty(self):
+        return len(self) == 0
+
+    def all_text(self, i):
+        """Title, summary and key learnings of row i combined for search."""
+        return self.titles[i] + " " + self.summaries[i] + " " + " ".join(self.key_learnings.row(i))
+
+    def tags(self, i):
+        return {facet: self.facets[facet].row(i) for facet in TAG_FACETS}
+
+    def column(self, name, rows):
+        if name == 'url':
+            return [self.urls[i] for i in rows]
+        if name == 'title':
+            return [self.titles[i] for i in rows]
+        if name == 'summary':
+            return [self.summaries[i] for i in rows]
+        if name == 'key_learnings':
+            return self.key_learnings.take(rows)
+        if name == 'speakers':
+            return self.speakers.take(rows)
+        if name in self.facets:
+            return self.facets[name].take(rows)
+        if name == 'tags':
+            return [self.tags(i) for i in rows]
+        if name == 'all_text':
+            return [self.all_text(i) for i in rows]
+        raise KeyError(name)
+
+    def sort_rank(self, name):
+        """
+        Case-insensitive rank of every row by a sortable column, built once
+        per column and reused for every sort of any row subset.
+        """
+        if name not in SORTABLE_COLUMNS:
+            raise KeyError(name)
+        if name not in self._ranks:
+            keys = [v.casefold() for v in self.column(name, range(len(self)))]
+            order = sorted(range(len(keys)), key=keys.__getitem__)
+            rank = np.empty(len(keys), dtype=np.int64)
+            rank[order] = np.arange(len(keys))
+            self._ranks[name] = rank
+        return self._ranks[name]
+
+    def to_frame(self, rows=None, columns=None):
+        """
+        Materializes a DataFrame view of the selected rows and columns.
+        The index holds corpus row numbers so the frame can be passed back
+        to the Analyzer.
+        """
+        import pandas as pd
+
+        if rows is None:
+            rows = np.arange(len(self))
+        rows = np.asarray(rows, dtype=np.int64)
+        columns = columns or DEFAULT_COLUMNS
+        return pd.DataFrame({name: self.column(name, rows) for name in columns},
+                            index=pd.Index(rows), columns=columns)
+
+
+def popcount(words):
+    """Number of set bits along the last axis of a uint64 array."""
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(words).sum(axis=-1, dtype=np.int64)
+    as_bytes = words.view(np.uint8)
+    return _BYTE_POPCOUNT[as_bytes].sum(axis=-1, dtype=np.int64)
+
+
+_BYTE_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def _text(value):
+    return value if isinstance(value, str) else ""
+
+
+def _string_list(value):
+    if not isinstance(value, list):
+        return []
+    return [v for v in value if isinstance(v, str)]
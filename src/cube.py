@@ -0,0 +1,232 @@
+import argparse
+import csv
+import gzip
+import hashlib
+import html
+import json
+import os
+import re
+import time
+from collections import Counter
+from itertools import combinations
+from .analyzer import Analyzer
+from .corpus import TAG_FACETS
+from .parallel import (trend_partial, theme_partial, intersection_partial,
+                       reduce_trends, reduce_theme_concepts, reduce_intersections)
+from .recommender import Recommender
+from .utils import setup_logger
+
+logger = setup_logger('cube')
+
+CUBE_VERSION = 1
+TREND_KEYS = ('top_topics', 'top_phrases', 'top_trigrams')
+
+def cube_path(data_file):
+    """Default cube file next to the dataset, e.g. data/au_2025.cube.json.gz."""
+    return os.path.splitext(data_file)[0] + ".cube.json.gz"
+
+def file_digest(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+def slice_key(topics=(), industries=(), products=()):
+    """
+    Cube key of a selection with at most one value per facet, e.g.
+    'topics=AI|products=Revit' ('all' when nothing is selected).
+    Returns None for selections the cube cannot hold.
+    """
+    parts = []
+    for facet, values in zip(TAG_FACETS, (topics, industries, products)):
+        values = values or ()
+        if len(values) > 1:
+            return None
+        if values:
+            parts.append(f"{facet}={values[0]}")
+    return "|".join(parts) or "all"
+
+def plan_slices(corpus, max_pairs=100, min_pair_rows=5):
+    """Every single facet value, plus the most common cross-facet value pairs."""
+    slices = [{}]
+    for facet in TAG_FACETS:
+        slices.extend({facet: [value]} for value in corpus.facets[facet].sorted_values())
+
+    pair_counts = Counter()
+    for row in range(len(corpus)):
+        tags = corpus.tags(row)
+        for f1, f2 in combinations(TAG_FACETS, 2):
+            for v1 in dict.fromkeys(tags[f1]):
+                for v2 in dict.fromkeys(tags[f2]):
+                    pair_counts[(f1, v1, f2, v2)] += 1
+    for (f1, v1, f2, v2), count in pair_counts.most_common(max_pairs):
+        if count < min_pair_rows:
+            break
+        slices.append({f1: [v1], f2: [v2]})
+    return slices
+
+def build_cube(analyzer, data_file, max_pairs=100, min_pair_rows=5):
+    """
+    Materializes trends, themes, intersections and recommender scores for
+    every planned slice. Each class is tokenized once into partial counts,
+    and each slice is reduced from the partials of its rows, giving the
+    same results as the Analyzer would for that selection.
+    """
+    corpus = analyzer.corpus
+    topics = corpus.facets['topics']
+
+    trend_parts, theme_parts, intersection_parts = [], [], []
+    for row in range(len(corpus)):
+        topic_rows = [topics.row_ids(row).tolist()]
+        trend_parts.append(trend_partial([corpus.titles[row]], [corpus.summaries[row]], topic_rows))
+        theme_parts.append(theme_partial([corpus.summaries[row]]))
+        intersection_parts.append(intersection_partial(topic_rows))
+
+    recommender = Recommender(analyzer)
+    slices = {}
+    for selection in plan_slices(corpus, max_pairs, min_pair_rows):
+        selected = [selection.get(facet) for facet in TAG_FACETS]
+        rows = analyzer.filter_rows(*selected)
+        if len(rows) == 0:
+            continue
+        trends = reduce_trends([trend_parts[r] for r in rows], topics.vocab)
+        concepts = reduce_theme_concepts([theme_parts[r] for r in rows])
+        slices[slice_key(*selected)] = {
+            'classes': len(rows),
+            **trends,
+            'themes': analyzer.insights_for_concepts(concepts, [corpus.summaries[r] for r in rows]),
+            'intersections': reduce_intersections([intersection_parts[r] for r in rows], topics.vocab),
+            'recommendations': [[s['trend'], s['score']] for s in recommender.suggest_future_topics(trends)],
+        }
+
+    return {
+        'version': CUBE_VERSION,
+        'source': data_file,
+        'source_digest': file_digest(data_file),
+        'built': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'classes': len(corpus),
+        'slices': slices,
+    }
+
+def save_cube(cube, path):
+    with gzip.open(path, 'wt', encoding='utf-8') as f:
+        json.dump(cube, f, ensure_ascii=False, separators=(',', ':'))
+
+def load_cube(path, data_file=None):
+    """Loads a cube, or returns None if it is missing, outdated or built from other data."""
+    if not os.path.exists(path):
+        return None
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        cube = json.load(f)
+    if cube.get('version') != CUBE_VERSION:
+        return None
+    if data_file and (not os.path.exists(data_file) or file_digest(data_file) != cube.get('source_digest')):
+        return None
+    return cube
+
+def lookup(cube, topics=(), industries=(), products=()):
+    """Precomputed slice for a selection, or None if the cube does not hold it."""
+    if not cube:
+        return None
+    return cube['slices'].get(slice_key(topics, industries, products))
+
+
+# --- Reports -----------------------------------------------------------------
+
+def _slug(index, key):
+    return f"{index:04d}-{re.sub(r'[^a-z0-9]+', '-', key.lower()).strip('-')[:60]}.html"
+
+def _table(headers, rows):
+    head = "".join(f"<th>{html.escape(str(h))}</th>" for h in headers)
+    body = "".join("<tr>" + "".join(f"<td>{html.escape(str(c))}</td>" for c in row) + "</tr>" for row in rows)
+    return f"<table><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>"
+
+def _page(title, body):
+    return (f"<!DOCTYPE html><html><head><meta charset='utf-8'><title>{html.escape(title)}</title>"
+            "<style>body{font-family:sans-serif;margin:2em}table{border-collapse:collapse;margin-bottom:1.5em}"
+            "td,th{border:1px solid #ccc;padding:4px 8px;text-align:left}</style></head>"
+            f"<body><h1>{html.escape(title)}</h1>{body}</body></html>")
+
+def render_reports(cube, out_dir):
+    """Writes one HTML page per slice, an index page and long-format CSVs."""
+    os.makedirs(os.path.join(out_dir, 'slices'), exist_ok=True)
+    tables = {name: [] for name in ('topics', 'phrases', 'trigrams', 'themes', 'intersections', 'recommendations')}
+    index_rows = []
+
+    for i, (key, data) in enumerate(cube['slices'].items()):
+        tables['topics'] += [(key, rank, t, c) for rank, (t, c) in enumerate(data['top_topics'], 1)]
+        tables['phrases'] += [(key, rank, p, c) for rank, (p, c) in enumerate(data['top_phrases'], 1)]
+        tables['trigrams'] += [(key, rank, p, c) for rank, (p, c) in enumerate(data['top_trigrams'], 1)]
+        tables['themes'] += [(key, rank, theme) for rank, theme in enumerate(data['themes'], 1)]
+        tables['intersections'] += [(key, t1, t2, c) for t1, pairs in data['intersections'].items() for t2, c in pairs]
+        tables['recommendations'] += [(key, rank, t, s) for rank, (t, s) in enumerate(data['recommendations'], 1)]
+
+        body = (f"<p>{data['classes']} classes. <a href='../index.html'>All reports</a></p>"
+                "<h2>Top Topics</h2>" + _table(['Topic', 'Count'], data['top_topics']) +
+                "<h2>Common Phrases</h2>" + _table(['Phrase', 'Count'], data['top_phrases']) +
+                "<h2>Common Trigrams</h2>" + _table(['Trigram', 'Count'], data['top_trigrams']) +
+                "<h2>Key Themes</h2>" + _table(['#', 'Theme'], list(enumerate(data['themes'], 1))) +
+                "<h2>Strategic Opportunities</h2>" + _table(['Trend', 'Score'], data['recommendations']) +
+                "<h2>Topic Intersections</h2>" +
+                _table(['Topic', 'Appears with'], [(t1, ", ".join(f"{t2} ({c})" for t2, c in pairs))
+                                                   for t1, pairs in data['intersections'].items()]))
+        page = _slug(i, key)
+        with open(os.path.join(out_dir, 'slices', page), 'w', encoding='utf-8') as f:
+            f.write(_page(key.replace('|', ' & '), body))
+        index_rows.append(f"<tr><td><a href='slices/{page}'>{html.escape(key.replace('|', ' & '))}</a></td>"
+                          f"<td>{data['classes']}</td></tr>")
+
+    headers = {
+        'topics': ['slice', 'rank', 'topic', 'count'],
+        'phrases': ['slice', 'rank', 'phrase', 'count'],
+        'trigrams': ['slice', 'rank', 'trigram', 'count'],
+        'themes': ['slice', 'rank', 'theme'],
+        'intersections': ['slice', 'topic', 'co_topic', 'count'],
+        'recommendations': ['slice', 'rank', 'trend', 'score'],
+    }
+    for name, rows in tables.items():
+        with open(os.path.join(out_dir, f"{name}.csv"), 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(headers[name])
+            writer.writerows(rows)
+
+    index = (f"<p>Built {html.escape(cube['built'])} from {html.escape(cube['source'])} ({cube['classes']} classes). "
+             + ", ".join(f"<a href='{name}.csv'>{name}.csv</a>" for name in tables) + "</p>"
+             "<table><thead><tr><th>Slice</th><th>Classes</th></tr></thead><tbody>"
+             + "".join(index_rows) + "</tbody></table>")
+    with open(os.path.join(out_dir, 'index.html'), 'w', encoding='utf-8') as f:
+        f.write(_page("AU Trend Reports", index))
+    return len(index_rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Precompute the trend cube and render batch reports.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    build = commands.add_parser('build', help="Build the cube (and optionally render reports)")
+    build.add_argument('--data', default="data/au_2025.json")
+    build.add_argument('--out', help="Cube file (default: next to the data file)")
+    build.add_argument('--max-pairs', type=int, default=100, help="Most common facet pairs to include")
+    build.add_argument('--min-pair-rows', type=int, default=5, help="Smallest facet pair worth a slice")
+    build.add_argument('--report-dir', help="Also render HTML/CSV reports here")
+
+    report = commands.add_parser('report', help="Render HTML/CSV reports from an existing cube")
+    report.add_argument('--cube', default=cube_path("data/au_2025.json"))
+    report.add_argument('--out', default="reports")
+
+    args = parser.parse_args()
+    if args.command == 'build':
+        start = time.perf_counter()
+        cube = build_cube(Analyzer(args.data), args.data, args.max_pairs, args.min_pair_rows)
+        out = args.out or cube_path(args.data)
+        save_cube(cube, out)
+        logger.info(f"Built {len(cube['slices'])} slices in {time.perf_counter() - start:.1f}s -> {out} "
+                    f"({os.path.getsize(out) // 1024} KB)")
+        report_dir = args.report_dir
+    else:
+        cube = load_cube(args.cube)
+        if cube is None:
+            parser.error(f"No usable cube at {args.cube}; run the 'build' command first.")
+        report_dir = args.out
+
+    if report_dir:
+        count = render_reports(cube, report_dir)
+        logger.info(f"Rendered {count} slice reports to {report_dir}")
@@ -0,0 +1,120 @@
+import asyncio
+import argparse
+import random
+import time
+from .service import QueryService, LocalClient
+
+DEFAULT_TARGETS = [
+    "/trends",
+    "/themes",
+    "/intersections",
+    "/recommendations",
+    "/filter?limit=20",
+    "/trends?topics=Software+Development",
+    "/themes?topics=Software+Development",
+    "/intersections?industries=Architecture",
+]
+
+class HttpClient:
+    """Keep-alive HTTP client over a single asyncio connection."""
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.reader = None
+        self.writer = None
+
+    async def get(self, target):
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        self.writer.write(f"GET {target} HTTP/1.1\r\nHost: {self.host}\r\n\r\n".encode('latin-1'))
+        await self.writer.drain()
+
+        status = int((await self.reader.readline()).split()[1])
+        length = 0
+        while True:
+            line = await self.reader.readline()
+            if line in (b'\r\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            if name.lower() == 'content-length':
+                length = int(value)
+        body = await self.reader.readexactly(length)
+        return status, body
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+def percentile(sorted_values, pct):
+    if not sorted_values: return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+async def run_load(make_client, targets, concurrency=16, total=1000, seed=0):
+    """Issues `total` requests from `concurrency` clients and returns latency/throughput stats."""
+    rng = random.Random(seed)
+    plan = [rng.choice(targets) for _ in range(total)]
+    latencies = []
+    errors = 0
+
+    async def worker():
+        nonlocal errors
+        client = make_client()
+        try:
+            while plan:
+                target = plan.pop()
+                start = time.perf_counter()
+                status, _ = await client.get(target)
+                latencies.append(time.perf_counter() - start)
+                if status != 200:
+                    errors += 1
+        finally:
+            if hasattr(client, 'close'):
+                client.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'seconds': elapsed,
+        'throughput': len(latencies) / elapsed if elapsed else 0.0,
+        'p50_ms': percentile(latencies, 50) * 1000,
+        'p99_ms': percentile(latencies, 99) * 1000,
+    }
+
+async def main(args):
+    targets = args.target or DEFAULT_TARGETS
+    service = None
+    if args.local:
+        service = QueryService(args.data, workers=args.workers)
+        make_client = lambda: LocalClient(service)
+    else:
+        make_client = lambda: HttpClient(args.host, args.port)
+
+    try:
+        stats = await run_load(make_client, targets, args.concurrency, args.requests)
+    finally:
+        if service is not None:
+            service.close()
+
+    print(f"Requests:   {stats['requests']} ({stats['errors']} errors) in {stats['seconds']:.2f}s")
+    print(f"Throughput: {stats['throughput']:.1f} req/s")
+    print(f"Latency:    p50 {stats['p50_ms']:.1f} ms, p99 {stats['p99_ms']:.1f} ms")
+    if service is not None:
+        print(f"Service:    {service.stats}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test the AU trend query service.")
+    parser.add_argument('--host', default="127.0.0.1")
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--target', action='append', help="Request target, e.g. /trends?topics=AI (repeatable)")
+    parser.add_argument('--local', action='store_true', help="Run against an in-process service instead of HTTP")
+    parser.add_argument('--data', default="data/au_2025.json")
+    parser.add_argument('--workers', type=int, default=None)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,208 @@
+import os
+import weakref
+import numpy as np
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from .analyzer import WORD_PATTERN, TREND_STOPWORDS, THEME_STOPWORDS
+
+# Below this many rows the serial path is faster (see `python -m src.bench_parallel`).
+# Measured break-even with 2 workers on one core; extra cores only lower it, so
+# re-run the benchmark on the serving machine before tuning it down.
+PARALLEL_MIN_ROWS = 40000
+
+
+class NgramPartial:
+    """
+    N-gram counts for one shard of a word stream, plus the words at its edges
+    so phrases spanning shard boundaries can be counted in the reduce step.
+    """
+    def __init__(self, words, n):
+        self.counts = Counter(" ".join(words[i:i + n]) for i in range(len(words) - n + 1))
+        self.head = words[:n - 1]
+        self.tail = words[-n:]
+        self.size = len(words)
+
+
+def should_parallelize(n_rows):
+    """Auto-selection rule: large enough corpus and more than one core."""
+    return n_rows >= PARALLEL_MIN_ROWS and (os.cpu_count() or 1) > 1
+
+
+def merge_ngrams(partials, n):
+    """
+    Reduces shard partials (in stream order) into the counts the serial code
+    gets from the concatenated stream. Each phrase is counted in the shard
+    where it ends, so insertion order (and hence most_common tie order)
+    matches the serial Counter. Returns (counts, last n words, total words).
+    """
+    counts = Counter()
+    last = []
+    size = 0
+    for part in partials:
+        carry = last[-(n - 1):]
+        window = carry + part.head
+        counts.update(" ".join(window[i:i + n]) for i in range(len(carry)) if i + n <= len(window))
+        counts.update(part.counts)
+        last = (last + part.tail)[-n:]
+        size += part.size
+    return counts, last, size
+
+
+def merge_co_occurrences(partials):
+    merged = {}
+    for part in partials:
+        for t1, counter in part.items():
+            merged.setdefault(t1, Counter()).update(counter)
+    return merged
+
+
+# --- Map / reduce steps (pure, shared by the process pool and the trend cube) --
+
+def trend_partial(titles, summaries, topic_rows):
+    text = " ".join(t + " " + s for t, s in zip(titles, summaries)).lower()
+    words = [w for w in WORD_PATTERN.findall(text) if w not in TREND_STOPWORDS]
+    topics = Counter()
+    for ids in topic_rows:
+        topics.update(ids)
+    return topics, NgramPartial(words, 2), NgramPartial(words, 3)
+
+def theme_partial(summaries):
+    text = " ".join(summaries).lower()
+    words = [w for w in WORD_PATTERN.findall(text) if w not in THEME_STOPWORDS]
+    return NgramPartial(words, 3)
+
+def intersection_partial(topic_rows):
+    co_occurrences = {}
+    for topics in topic_rows:
+        for i in range(len(topics)):
+            counter = co_occurrences.setdefault(topics[i], Counter())
+            for j in range(len(topics)):
+                if i != j:
+                    counter[topics[j]] += 1
+    return co_occurrences
+
+def reduce_trends(partials, vocab):
+    """Same result as Analyzer.summarize_trends over the rows behind `partials`."""
+    topics = Counter()
+    for topic_counts, _, _ in partials:
+        topics.update(topic_counts)
+    bigrams, _, _ = merge_ngrams([p[1] for p in partials], 2)
+    trigrams, _, _ = merge_ngrams([p[2] for p in partials], 3)
+    return {
+        'top_topics': [(vocab[t], c) for t, c in topics.most_common(15)],
+        'top_phrases': bigrams.most_common(15),
+        'top_trigrams': trigrams.most_common(10)
+    }
+
+def reduce_theme_concepts(partials):
+    """Same concept counts as the first step of Analyzer.get_key_themes."""
+    concepts, last, size = merge_ngrams(partials, 3)
+    # get_key_themes stops one phrase short of the end of the stream
+    if size >= 3:
+        final = " ".join(last)
+        concepts[final] -= 1
+        if concepts[final] == 0:
+            del concepts[final]
+    return concepts.most_common(20)
+
+def reduce_intersections(partials, vocab):
+    """Same result as Analyzer.get_topic_intersections."""
+    merged = merge_co_occurrences(partials)
+    return {vocab[t1]: [(vocab[t2], c) for t2, c in counter.most_common(5)]
+            for t1, counter in merged.items()}
+
+
+# --- Worker side -------------------------------------------------------------
+
+# Shared-memory views attached once per worker process
+_shared = {}
+
+def _attach(layout):
+    for name, (shm_name, dtype, shape) in layout.items():
+        shm = shared_memory.SharedMemory(name=shm_name)
+        _shared[name] = (shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf))
+
+def _array(name):
+    return _shared[name][1]
+
+def _texts(field, rows):
+    blob, offsets = _array(field), _array(field + '_offsets')
+    return [bytes(blob[offsets[r]:offsets[r + 1]]).decode('utf-8') for r in rows]
+
+def _topic_rows(rows):
+    ids, offsets = _array('topic_ids'), _array('topic_offsets')
+    return [ids[offsets[r]:offsets[r + 1]].tolist() for r in rows]
+
+def _map_trends(rows):
+    return trend_partial(_texts('titles', rows), _texts('summaries', rows), _topic_rows(rows))
+
+def _map_themes(rows):
+    return theme_partial(_texts('summaries', rows))
+
+def _map_intersections(rows):
+    return intersection_partial(_topic_rows(rows))
+
+
+# --- Coordinator side --------------------------------------------------------
+
+def _encode(texts):
+    encoded = [t.encode('utf-8') for t in texts]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    return np.frombuffer(b"".join(encoded) or b"\0", dtype=np.uint8), offsets
+
+def _release(pool, segments):
+    pool.shutdown(wait=False, cancel_futures=True)
+    for shm in segments:
+        shm.close()
+        shm.unlink()
+
+
+class ParallelRunner:
+    """
+    Runs the Analyzer's counting passes as map-reduce over a process pool.
+
+    The corpus text and topic IDs are copied once into shared memory; each
+    task receives only a contiguous slice of row numbers, and the partial
+    counts are reduced here in shard order so results match the serial path.
+    """
+    def __init__(self, corpus, workers=None):
+        self.corpus = corpus
+        self.workers = workers or os.cpu_count() or 1
+
+        topics = corpus.facets['topics']
+        arrays = {'topic_ids': topics.ids, 'topic_offsets': topics.offsets}
+        arrays['titles'], arrays['titles_offsets'] = _encode(corpus.titles)
+        arrays['summaries'], arrays['summaries_offsets'] = _encode(corpus.summaries)
+
+        segments = []
+        layout = {}
+        for name, array in arrays.items():
+            shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[:] = array
+            segments.append(shm)
+            layout[name] = (shm.name, array.dtype.str, array.shape)
+
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_attach, initargs=(layout,))
+        self._finalizer = weakref.finalize(self, _release, self.pool, segments)
+
+    def close(self):
+        # Wait for the workers here; the finalizer only runs the non-blocking
+        # shutdown when the runner is garbage collected without close()
+        if self._finalizer.alive:
+            self.pool.shutdown(wait=True, cancel_futures=True)
+        self._finalizer()
+
+    def _map(self, fn, rows):
+        shards = [s for s in np.array_split(np.asarray(rows), self.workers * 4) if len(s)]
+        return list(self.pool.map(fn, shards))
+
+    def summarize_trends(self, rows):
+        return reduce_trends(self._map(_map_trends, rows), self.corpus.facets['topics'].vocab)
+
+    def theme_concepts(self, rows):
+        return reduce_theme_concepts(self._map(_map_themes, rows))
+
+    def topic_intersections(self, rows):
+        return reduce_intersections(self._map(_map_intersections, rows), self.corpus.facets['topics'].vocab)
@@ -10,12 +10,14 @@ class Recommender:
             "Industrialized Construction": ["Prefab", "Modular", "Manufacturing"]
         }
 
-    def suggest_future_topics(self):
+    def suggest_future_topics(self, trends=None):
         """
         Analyzes alignment between AU 2025 content and Global External Trends.
         Returns a broad list of opportunities based on keyword correlation.
+        trends: a summarize_trends() result to score instead of the whole corpus.
         """
-        trends = self.analyzer.summarize_trends()
+        if trends is None:
+            trends = self.analyzer.summarize_trends()
         if not trends: return []
         
         top_topics = trends.get('top_topics', [])
@@ -4,14 +4,77 @@ from bs4 import BeautifulSoup
 import pandas as pd
 import json
 import os
+from urllib.parse import urlencode
 from .utils import setup_logger, save_json
 
 logger = setup_logger('scraper')
 
-async def get_class_list(page):
-    """Scrapes the search results page regarding 2025 classes."""
-    # Updated URL for Software Development topic
-    url = "https://www.autodesk.com/autodesk-university/search?fields.year=2025&fields.topic=Software+Development&fields.recordtype=class"
+SEARCH_URL = "https://www.autodesk.com/autodesk-university/search"
+CLASS_LINK_SELECTOR = 'a[href*="/autodesk-university/class/"]'
+NEXT_BUTTON_SELECTOR = 'button[aria-label="Go to next page"]'
+
+def listing_url(year=2025, topic="Software Development"):
+    """Search URL listing the classes of one year (and optionally one topic)."""
+    fields = {'fields.year': year}
+    if topic:
+        fields['fields.topic'] = topic
+    fields['fields.recordtype'] = 'class'
+    return f"{SEARCH_URL}?{urlencode(fields)}"
+
+async def launch_browser(p, headless=False):
+    """Starts Chromium with the settings the AU site accepts. Returns (browser, context)."""
+    browser = await p.chromium.launch(
+        headless=headless,
+        args=['--disable-blink-features=AutomationControlled', '--no-sandbox', '--disable-setuid-sandbox']
+    )
+    context = await browser.new_context(
+        user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
+        viewport={'width': 1920, 'height': 1080},
+        locale='en-US'
+    )
+    await context.add_init_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    return browser, context
+
+async def _next_button_visible(page):
+    try:
+        next_btn_loc = page.locator(NEXT_BUTTON_SELECTOR)
+        if await next_btn_loc.count() > 0:
+             return await next_btn_loc.is_visible() and not await next_btn_loc.is_disabled()
+    except:
+        pass
+    return False
+
+async def _click_next(page, current_page_first_item):
+    """Clicks 'next page' and waits for the results to change. Returns False on error."""
+    try:
+        await page.locator(NEXT_BUTTON_SELECTOR).click()
+        
+        # Check for content change
+        changed = False
+        for _ in range(20):
+            await asyncio.sleep(1)
+            content_check = await page.content()
+            soup_check = BeautifulSoup(content_check, 'html.parser')
+            new_first = soup_check.select_one(CLASS_LINK_SELECTOR)
+            if new_first and new_first.get('href') != current_page_first_item:
+                changed = True
+                break
+        if not changed:
+            logger.warning("Page content did not appear to change. Might be stuck.")
+        return True
+    except Exception as e:
+        logger.error(f"Error clicking next: {e}")
+        return False
+
+async def get_class_list(page, url=None, start_page=1, on_page=None, on_skip=None):
+    """
+    Scrapes the search results pages regarding 2025 classes.
+    start_page skips ahead (without extracting) to resume an interrupted
+    listing; on_skip(page_num) is called after each skipped page and
+    on_page(page_num, links) after each processed page.
+    """
+    # Default: 2025 classes for the Software Development topic
+    url = url or listing_url()
     logger.info(f"Navigating to {url}")
     await page.goto(url, timeout=60000)
     
@@ -26,6 +89,22 @@ async def get_class_list(page):
     all_links = {} # {url: title}
     page_num = 1
     
+    # Resume: fast-forward through pages already processed in an earlier run
+    while page_num < start_page:
+        try:
+            await page.wait_for_selector(CLASS_LINK_SELECTOR, state='visible', timeout=20000)
+        except:
+            logger.warning("Timeout waiting for links.")
+        first = BeautifulSoup(await page.content(), 'html.parser').select_one(CLASS_LINK_SELECTOR)
+        if not await _next_button_visible(page) or not await _click_next(page, first.get('href') if first else None):
+            logger.warning(f"Could not skip past page {page_num}; resuming from there.")
+            break
+        if on_skip:
+            on_skip(page_num)
+        page_num += 1
+    if page_num > 1:
+        logger.info(f"Resumed listing at page {page_num}.")
+    
     while True:
         logger.info(f"Processing Page {page_num}...")
         
@@ -38,7 +117,7 @@ async def get_class_list(page):
         while retry_count < max_retries:
             # Wait for content
             try:
-                await page.wait_for_selector('a[href*="/autodesk-university/class/"]', state='visible', timeout=20000)
+                await page.wait_for_selector(CLASS_LINK_SELECTOR, state='visible', timeout=20000)
             except:
                 logger.warning("Timeout waiting for links.")
             
@@ -50,16 +129,11 @@ async def get_class_list(page):
             content = await page.content()
             soup = BeautifulSoup(content, 'html.parser')
             
-            found_links_on_page = soup.select('a[href*="/autodesk-university/class/"]')
+            found_links_on_page = soup.select(CLASS_LINK_SELECTOR)
             count = len(found_links_on_page)
             
             # Check for next button to determine if we expect a full page
-            try:
-                next_btn_loc = page.locator('button[aria-label="Go to next page"]')
-                if await next_btn_loc.count() > 0:
-                     next_btn_visible = await next_btn_loc.is_visible() and not await next_btn_loc.is_disabled()
-            except:
-                next_btn_visible = False
+            next_btn_visible = await _next_button_visible(page)
             
             logger.info(f"Detected {count} classes on page {page_num} (Attempt {retry_count+1}). Next Page Available: {next_btn_visible}")
             
@@ -78,6 +152,7 @@ async def get_class_list(page):
 
         # Add Links (With Titles for deduplication)
         new_links = 0
+        page_links = []
         current_page_first_item = None
         
         if found_links_on_page:
@@ -90,33 +165,19 @@ async def get_class_list(page):
             
             if url_full not in all_links:
                 all_links[url_full] = title
+                page_links.append({'url': url_full, 'title': title})
                 new_links += 1
         
         logger.info(f"Found {new_links} new unique classes on this page. Total unique so far: {len(all_links)}")
+        if on_page:
+            on_page(page_num, page_links)
 
         # Pagination logic
         if next_btn_visible:
             logger.info("Clicking next page...")
-            try:
-                await page.locator('button[aria-label="Go to next page"]').click()
-                
-                # Check for content change
-                changed = False
-                for _ in range(20):
-                    await asyncio.sleep(1)
-                    content_check = await page.content()
-                    soup_check = BeautifulSoup(content_check, 'html.parser')
-                    new_first = soup_check.select_one('a[href*="/autodesk-university/class/"]')
-                    if new_first and new_first.get('href') != current_page_first_item:
-                        changed = True
-                        break
-                if not changed:
-                    logger.warning("Page content did not appear to change. Might be stuck.")
-                    
-                page_num += 1
-            except Exception as e:
-                logger.error(f"Error clicking next: {e}")
+            if not await _click_next(page, current_page_first_item):
                 break
+            page_num += 1
         else:
             logger.info("Reached last page.")
             break
@@ -216,16 +277,7 @@ async def scrape_all(limit=None):
     existing_urls = set(item.get('url', '') for item in existing_data)
 
     async with async_playwright() as p:
-        browser = await p.chromium.launch(
-            headless=False,
-            args=['--disable-blink-features=AutomationControlled', '--no-sandbox', '--disable-setuid-sandbox']
-        )
-        context = await browser.new_context(
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
-            viewport={'width': 1920, 'height': 1080},
-            locale='en-US'
-        )
-        await context.add_init_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        browser, context = await launch_browser(p)
         
         page = await context.new_page()
         
@@ -0,0 +1,204 @@
+import asyncio
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from urllib.parse import urlsplit, parse_qs
+from .analyzer import Analyzer
+from .corpus import TAG_FACETS
+from .recommender import Recommender
+from .utils import setup_logger
+
+logger = setup_logger('service')
+
+ENDPOINTS = ('filter', 'trends', 'themes', 'intersections', 'recommendations')
+CLASS_COLUMNS = ['title', 'url', 'topics', 'industries', 'products']
+
+# Analyzer owned by a worker process of the pool (loaded once per worker)
+_worker_analyzer = None
+
+def _init_worker(data_file):
+    global _worker_analyzer
+    # The service pool already spreads queries across cores; a nested
+    # ParallelRunner per worker would multiply processes and corpus copies
+    _worker_analyzer = Analyzer(data_file, parallel=False)
+
+def _class_count():
+    return len(_worker_analyzer.corpus)
+
+def run_query(endpoint, params, analyzer=None):
+    """Executes one query and returns a JSON-serializable result."""
+    analyzer = analyzer or _worker_analyzer
+
+    if endpoint == 'recommendations':
+        return Recommender(analyzer).suggest_future_topics()
+
+    selected = [params.get(facet) or None for facet in TAG_FACETS]
+    rows = analyzer.filter_rows(*selected)
+
+    if endpoint == 'filter':
+        offset = int(params.get('offset', ['0'])[0])
+        limit = int(params.get('limit', ['100'])[0])
+        if offset < 0 or limit < 0:
+            raise ValueError("offset and limit must not be negative")
+        page = analyzer.corpus.to_frame(rows[offset:offset + limit], CLASS_COLUMNS)
+        return {'count': len(rows), 'offset': offset, 'classes': page.to_dict('records')}
+    if endpoint == 'trends':
+        return analyzer.summarize_trends(rows)
+    if endpoint == 'themes':
+        return analyzer.get_key_themes(rows)
+    if endpoint == 'intersections':
+        return analyzer.get_topic_intersections(rows)
+    raise ValueError(f"Unknown endpoint: {endpoint}")
+
+
+class QueryService:
+    """
+    Serves Analyzer/Recommender queries over HTTP.
+
+    Identical concurrent queries are coalesced into one computation, and the
+    computation runs in a worker pool so the event loop stays responsive.
+    With workers=0 queries run on a single thread against the service's own
+    Analyzer (used by LocalClient and tests); otherwise only the workers load
+    the corpus.
+    """
+    def __init__(self, data_file="data/au_2025.json", workers=None):
+        self.data_file = data_file
+        self.workers = os.cpu_count() if workers is None else workers
+        self.analyzer = Analyzer(data_file) if self.workers == 0 else None
+        self.executor = None
+        self._classes = None
+        self._inflight = {}
+        self.stats = {'requests': 0, 'computed': 0, 'coalesced': 0}
+
+    def start(self):
+        if self.executor is None:
+            if self.workers > 0:
+                self.executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                    initializer=_init_worker, initargs=(self.data_file,))
+            else:
+                self.executor = ThreadPoolExecutor(max_workers=1)
+        return self
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+
+    async def class_count(self):
+        """Number of classes served (asked of a worker when queries run in a pool)."""
+        if self._classes is None:
+            if self.analyzer is not None:
+                self._classes = len(self.analyzer.corpus)
+            else:
+                self.start()
+                loop = asyncio.get_running_loop()
+                self._classes = await loop.run_in_executor(self.executor, _class_count)
+        return self._classes
+
+    async def query(self, endpoint, params):
+        """Runs a query, sharing the result with any identical query already in flight."""
+        key = (endpoint, tuple(sorted((k, tuple(sorted(v))) for k, v in params.items())))
+        self.stats['requests'] += 1
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.stats['coalesced'] += 1
+        else:
+            self.stats['computed'] += 1
+            task = asyncio.ensure_future(self._compute(endpoint, params))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _compute(self, endpoint, params):
+        self.start()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, run_query, endpoint, params, self.analyzer)
+
+    async def dispatch(self, target):
+        """Routes a request target such as '/trends?topics=AI' to (status, payload)."""
+        url = urlsplit(target)
+        endpoint = url.path.strip('/')
+        params = parse_qs(url.query)
+
+        if endpoint == 'health':
+            return 200, {'status': 'ok', 'classes': await self.class_count(), **self.stats}
+        if endpoint not in ENDPOINTS:
+            return 404, {'error': f"Unknown endpoint: /{endpoint}"}
+        try:
+            return 200, await self.query(endpoint, params)
+        except ValueError as e:
+            return 400, {'error': str(e)}
+        except Exception as e:
+            logger.error(f"Error serving {target}: {e}")
+            return 500, {'error': str(e)}
+
+    async def handle_connection(self, reader, writer):
+        """Minimal HTTP/1.1 handler: GET requests, JSON responses, keep-alive."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, target, _ = request_line.decode('latin-1').split(' ', 2)
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                if 'content-length' in headers:
+                    await reader.readexactly(int(headers['content-length']))
+
+                if method != 'GET':
+                    status, payload = 405, {'error': f"Method {method} not allowed"}
+                else:
+                    status, payload = await self.dispatch(target)
+
+                body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                writer.write((f"HTTP/1.1 {status} {'OK' if status == 200 else 'Error'}\r\n"
+                              f"Content-Type: application/json; charset=utf-8\r\n"
+                              f"Content-Length: {len(body)}\r\n"
+                              f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n").encode('latin-1') + body)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ValueError, asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host="127.0.0.1", port=8080):
+        self.start()
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        logger.info(f"Serving {await self.class_count()} classes on http://{host}:{port} ({self.workers} workers)")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.close()
+
+
+class LocalClient:
+    """In-process client for QueryService that skips the network layer."""
+    def __init__(self, service):
+        self.service = service.start()
+
+    async def get(self, target):
+        status, payload = await self.service.dispatch(target)
+        # Round-trip through JSON so results look exactly like HTTP responses
+        return status, json.loads(json.dumps(payload, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve AU trend analysis over HTTP.")
+    parser.add_argument('--data', default="data/au_2025.json")
+    parser.add_argument('--host', default="127.0.0.1")
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (0 = run in-process)")
+    args = parser.parse_args()
+    asyncio.run(QueryService(args.data, workers=args.workers).serve(args.host, args.port))
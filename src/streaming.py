@@ -0,0 +1,224 @@
+import argparse
+import heapq
+import json
+from collections import Counter
+from .analyzer import WORD_PATTERN, TREND_STOPWORDS
+from .corpus import _text, _string_list
+from .utils import setup_logger
+
+logger = setup_logger('streaming')
+
+
+# Longest JSON token a chunk boundary can cut short of the end of the buffer
+# ('-Infinity', a \uXXXX escape); a decode error further back is malformed input
+_MAX_CUT_TOKEN = 16
+
+def iter_records(path, chunk_size=1 << 16, max_record_size=1 << 22):
+    """
+    Yields records one at a time from a JSON array file or a JSONL file,
+    reading `chunk_size` characters at a time instead of the whole file.
+    A record (or line) longer than `max_record_size` characters raises
+    ValueError, so memory stays bounded even for malformed input.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        first = f.read(1)
+        while first and first.isspace():
+            first = f.read(1)
+        if first != '[':
+            # JSON Lines: one record per line
+            line = first + f.readline(max_record_size + 1)
+            while line:
+                if len(line) > max_record_size:
+                    raise ValueError(f"Line longer than {max_record_size} characters in {path}")
+                if line.strip():
+                    yield json.loads(line)
+                line = f.readline(max_record_size + 1)
+            return
+
+        decoder = json.JSONDecoder()
+        buf = ""
+        eof = False
+        while True:
+            buf = buf.lstrip().lstrip(',').lstrip()
+            if buf.startswith(']'):
+                return
+            try:
+                record, end = decoder.raw_decode(buf)
+            except json.JSONDecodeError as e:
+                # Only a record cut off by the end of the buffer needs more input
+                truncated = e.msg.startswith("Unterminated string") or len(buf) - e.pos <= _MAX_CUT_TOKEN
+                if eof or not truncated:
+                    raise
+                if len(buf) > max_record_size:
+                    raise ValueError(f"Record longer than {max_record_size} characters in {path}")
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buf += chunk
+                continue
+            buf = buf[end:]
+            yield record
+
+
+class SpaceSaving:
+    """
+    Space-Saving heavy-hitters sketch holding at most `capacity` counters.
+
+    Each estimate over-counts its item by at most the item's `error`, and
+    every error is at most total / capacity, so any item seen more than
+    total / capacity times is guaranteed to be tracked.
+    """
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.total = 0
+        self.counters = {}   # item -> [estimate, error]
+        self._heap = []      # one (estimate, item) entry per counter, possibly stale (lower)
+
+    def add(self, item, weight=1):
+        self.total += weight
+        entry = self.counters.get(item)
+        if entry is not None:
+            entry[0] += weight
+            return
+        if len(self.counters) < self.capacity:
+            self.counters[item] = [weight, 0]
+            heapq.heappush(self._heap, (weight, item))
+            return
+
+        # Evict the smallest counter; stale heap entries are refreshed on the way
+        while True:
+            count, victim = heapq.heappop(self._heap)
+            current = self.counters[victim][0]
+            if current == count:
+                break
+            heapq.heappush(self._heap, (current, victim))
+        del self.counters[victim]
+        self.counters[item] = [count + weight, count]
+        heapq.heappush(self._heap, (count + weight, item))
+
+    @property
+    def max_error(self):
+        return self.total / self.capacity if len(self.counters) >= self.capacity else 0
+
+    def top(self, k):
+        """The k largest estimates as (item, estimate, error)."""
+        entries = heapq.nlargest(k, self.counters.items(), key=lambda kv: kv[1][0])
+        return [(item, est, err) for item, (est, err) in entries]
+
+
+class StreamingTrends:
+    """
+    summarize_trends() over a record stream with bounded memory: topics,
+    bigrams and trigrams are counted by Space-Saving sketches, and only the
+    last two words of the text stream are carried between records.
+    """
+    def __init__(self, capacity=5000, topic_capacity=500):
+        self.topics = SpaceSaving(topic_capacity)
+        self.bigrams = SpaceSaving(capacity)
+        self.trigrams = SpaceSaving(capacity)
+        self.records = 0
+        self._carry = []
+
+    def add(self, record):
+        self.records += 1
+        tags = record.get('tags')
+        for topic in _string_list(tags.get('topics') if isinstance(tags, dict) else None):
+            self.topics.add(topic)
+
+        # Same text and tokenization as summarize_trends; phrases span record boundaries
+        text = (_text(record.get('title')) + " " + _text(record.get('summary'))).lower()
+        words = self._carry + [w for w in WORD_PATTERN.findall(text) if w not in TREND_STOPWORDS]
+        start = len(self._carry)
+        for i in range(max(start - 1, 0), len(words) - 1):
+            self.bigrams.add(f"{words[i]} {words[i+1]}")
+        for i in range(max(start - 2, 0), len(words) - 2):
+            self.trigrams.add(f"{words[i]} {words[i+1]} {words[i+2]}")
+        self._carry = words[-2:]
+
+    def consume(self, records):
+        for record in records:
+            self.add(record)
+        return self
+
+    @classmethod
+    def from_file(cls, path, **kwargs):
+        return cls(**kwargs).consume(iter_records(path))
+
+    def summarize(self):
+        """Approximate summarize_trends() result, plus error bounds per list."""
+        sketches = {'top_topics': (self.topics, 15), 'top_phrases': (self.bigrams, 15),
+                    'top_trigrams': (self.trigrams, 10)}
+        result = {name: [(item, est) for item, est, _ in sketch.top(k)] for name, (sketch, k) in sketches.items()}
+        result['error_bounds'] = {
+            name: {
+                'total': sketch.total,
+                'capacity': sketch.capacity,
+                'max_error': sketch.max_error,
+                'item_errors': [err for _, _, err in sketch.top(k)],
+            }
+            for name, (sketch, k) in sketches.items()
+        }
+        return result
+
+
+def exact_counts(records):
+    """Exact topic/bigram/trigram Counters over the same stream (for checking)."""
+    topics, bigrams, trigrams = Counter(), Counter(), Counter()
+    words = []
+    for record in records:
+        tags = record.get('tags')
+        topics.update(_string_list(tags.get('topics') if isinstance(tags, dict) else None))
+        text = (_text(record.get('title')) + " " + _text(record.get('summary'))).lower()
+        words.extend(w for w in WORD_PATTERN.findall(text) if w not in TREND_STOPWORDS)
+    bigrams.update(f"{words[i]} {words[i+1]}" for i in range(len(words) - 1))
+    trigrams.update(f"{words[i]} {words[i+1]} {words[i+2]}" for i in range(len(words) - 2))
+    return {'top_topics': topics, 'top_phrases': bigrams, 'top_trigrams': trigrams}
+
+
+def check_against_exact(stream, exact):
+    """
+    Verifies the sketch guarantees against exact counts. Returns, per list,
+    the largest observed over-count, the bound, and whether every item above
+    the bound was tracked.
+    """
+    report = {}
+    sketches = {'top_topics': stream.topics, 'top_phrases': stream.bigrams, 'top_trigrams': stream.trigrams}
+    for name, sketch in sketches.items():
+        counts = exact[name]
+        observed = 0
+        for item, (est, err) in sketch.counters.items():
+            true = counts[item]
+            if not (true <= est <= true + err):
+                raise AssertionError(f"{name}: estimate {est} for '{item}' outside [{true}, {true + err}]")
+            observed = max(observed, est - true)
+        heavy = [item for item, c in counts.items() if c > sketch.max_error]
+        report[name] = {
+            'max_observed_error': observed,
+            'max_error_bound': sketch.max_error,
+            'heavy_hitters_tracked': all(item in sketch.counters for item in heavy),
+        }
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Approximate trend analysis over a JSON/JSONL stream.")
+    parser.add_argument('path', nargs='?', default="data/au_2025.json")
+    parser.add_argument('--capacity', type=int, default=5000, help="Counters per phrase sketch")
+    parser.add_argument('--topic-capacity', type=int, default=500)
+    parser.add_argument('--check', action='store_true', help="Compare against exact counts (reads the file twice)")
+    args = parser.parse_args()
+
+    stream = StreamingTrends.from_file(args.path, capacity=args.capacity, topic_capacity=args.topic_capacity)
+    result = stream.summarize()
+    logger.info(f"Streamed {stream.records} records")
+    for name in ('top_topics', 'top_phrases', 'top_trigrams'):
+        bounds = result['error_bounds'][name]
+        print(f"\n{name} (total {bounds['total']}, max error {bounds['max_error']:.1f}):")
+        for (item, est), err in zip(result[name], bounds['item_errors']):
+            print(f"  {est:6d} (+/-{err:<4d}) {item}")
+
+    if args.check:
+        report = check_against_exact(stream, exact_counts(iter_records(args.path)))
+        print("\nCheck against exact counts:")
+        for name, r in report.items():
+            print(f"  {name}: max observed error {r['max_observed_error']}, bound {r['max_error_bound']:.1f}, "
+                  f"heavy hitters tracked: {r['heavy_hitters_tracked']}")
@@ -0,0 +1,166 @@
+import asyncio
+import os
+import tempfile
+import time
+from src import coordinator
+from src.coordinator import WorkQueue, MAX_ATTEMPTS, STALE_SECONDS, scrape_listing
+from src.utils import load_json, save_json
+
+def finish_page(queue, page_num, links):
+    queue.listing_page_done("listing", page_num, links)
+    for item in queue.claim_details("worker", 10):
+        queue.detail_done(item)
+
+def links(*pages):
+    return [{'url': f"/class/{n}", 'title': f"Class {n}"} for n in pages]
+
+def statuses(queue, table):
+    return {r[0]: r[1] for r in queue.db.execute(f"SELECT url, status FROM {table}")}
+
+def age_listings(queue):
+    queue.db.execute("UPDATE listings SET updated = ?", (time.time() - STALE_SECONDS - 1,))
+
+class Crash(BaseException):
+    """Stands in for the worker process dying mid-listing."""
+
+def fake_listing(pages, crash_after=None, calls=None):
+    """A get_class_list stand-in serving `pages` pages of two classes each."""
+    async def list_pages(url, start_page, on_page, on_skip):
+        calls.append(start_page)
+        for n in range(1, start_page):
+            on_skip(n)
+        for n in range(start_page, pages + 1):
+            on_page(n, links(2 * n - 1, 2 * n))
+            if n == crash_after:
+                raise Crash()
+    return list_pages
+
+def test_claim_and_stale_takeover():
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = WorkQueue(os.path.join(tmp, "state.db"))
+        queue.add_listings(["listing"])
+        assert queue.claim_listing("worker-0") == ("listing", 0)
+        assert queue.claim_listing("worker-1") is None
+        queue.listing_page_done("listing", 2, [])
+
+        # Skipping pages on resume counts as progress
+        age_listings(queue)
+        queue.touch_listing("listing")
+        assert queue.claim_listing("worker-1") is None and queue.listings_open() == 1
+
+        # A listing with no checkpoint for STALE_SECONDS is taken over from its checkpoint
+        age_listings(queue)
+        assert queue.listings_open() == 0
+        assert queue.claim_listing("worker-1") == ("listing", 2)
+        assert queue.db.execute("SELECT owner FROM listings").fetchone()[0] == "worker-1"
+
+        # A late checkpoint from a resume that fell short never moves pages_done back
+        queue.listing_page_done("listing", 1, [])
+        assert queue.db.execute("SELECT pages_done FROM listings").fetchone()[0] == 2
+        queue.close()
+
+def test_listing_page_dedup():
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = WorkQueue(os.path.join(tmp, "state.db"))
+        page = [{'url': "/class/known", 'title': "Known URL"},
+                {'url': "/class/new-url", 'title': "  Known Title "},
+                {'url': "/class/repeat", 'title': "BIM Basics (Repeat)"},
+                {'url': "/class/a", 'title': "Intro to APIs"},
+                {'url': "/class/b", 'title': "intro to apis"},
+                {'url': "/class/a", 'title': "Intro to APIs"}]
+        queue.listing_page_done("listing", 1, page, skip_urls={"/class/known"}, skip_titles={"known title"})
+        # The same class listed again on a later page (or by another listing) is ignored
+        queue.listing_page_done("listing", 2, page[3:] + links(1))
+        assert list(statuses(queue, 'details')) == ["/class/a", "/class/1"]
+        queue.close()
+
+def test_detail_retries():
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = WorkQueue(os.path.join(tmp, "state.db"))
+        queue.listing_page_done("listing", 1, links(1))
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            [item] = queue.claim_details("worker", 5)
+            queue.detail_done({**item, 'error': "timeout"})
+            expected = 'failed' if attempt == MAX_ATTEMPTS else 'pending'
+            assert statuses(queue, 'details') == {"/class/1": expected}
+        assert queue.claim_details("worker", 5) == []
+        queue.close()
+
+def test_crash_and_resume():
+    with tempfile.TemporaryDirectory() as tmp:
+        state_file = os.path.join(tmp, "state.db")
+        calls = []
+
+        # First run: the worker dies after checkpointing page 2, holding a class page
+        queue = WorkQueue(state_file)
+        queue.add_listings(["listing"])
+        listing = queue.claim_listing("worker-0")
+        try:
+            asyncio.run(scrape_listing(queue, "worker-0", *listing, fake_listing(4, crash_after=2, calls=calls)))
+            raise AssertionError("the crash was swallowed")
+        except Crash:
+            pass
+        assert len(queue.claim_details("worker-0", 1)) == 1
+        queue.close()
+
+        # Second run: crashed work goes back to the queue and the listing resumes after page 2
+        queue = WorkQueue(state_file)
+        queue.requeue_running()
+        assert statuses(queue, 'listings') == {"listing": 'pending'}
+        assert set(statuses(queue, 'details').values()) == {'pending'}
+        listing = queue.claim_listing("worker-1")
+        assert listing == ("listing", 2)
+        asyncio.run(scrape_listing(queue, "worker-1", *listing, fake_listing(4, calls=calls)))
+        assert calls == [1, 3]
+        assert statuses(queue, 'listings') == {"listing": 'done'} and queue.listings_open() == 0
+        assert list(statuses(queue, 'details')) == [f"/class/{n}" for n in range(1, 9)]
+
+        # A listing that fails is retried by the next run
+        queue.add_listings(["broken"])
+        async def broken(url, start_page, on_page, on_skip):
+            raise RuntimeError("no results")
+        asyncio.run(scrape_listing(queue, "worker-1", *queue.claim_listing("worker-1"), broken))
+        assert statuses(queue, 'listings')["broken"] == 'failed'
+        queue.requeue_running()
+        assert statuses(queue, 'listings') == {"listing": 'done', "broken": 'pending'}
+        queue.close()
+
+def test_export():
+    with tempfile.TemporaryDirectory() as tmp:
+        output_file = os.path.join(tmp, "classes.json")
+        save_json([{'url': "old"}], output_file)
+        queue = WorkQueue(os.path.join(tmp, "state.db"))
+        queue.add_listings(["listing"])
+
+        finish_page(queue, 1, [{'url': "a", 'title': "A"}, {'url': "b", 'title': "B"}])
+        assert queue.export(output_file) == 2
+        assert [c['url'] for c in load_json(output_file)] == ["old", "a", "b"]
+        assert queue.export(output_file) == 0
+
+        # A failed swap leaves the dataset, the queue and the directory as they were
+        finish_page(queue, 2, [{'url': "c", 'title': "C"}])
+        def fail(src, dst):
+            raise OSError("disk full")
+        coordinator.os.replace, replace = fail, coordinator.os.replace
+        try:
+            queue.export(output_file)
+            raise AssertionError("export should have failed")
+        except OSError:
+            pass
+        finally:
+            coordinator.os.replace = replace
+        assert len(load_json(output_file)) == 3
+        assert queue.counts()['details_done'] == 1 and not queue.db.in_transaction
+        assert not os.path.exists(output_file + ".tmp")
+
+        assert queue.export(output_file) == 1
+        assert [c['url'] for c in load_json(output_file)] == ["old", "a", "b", "c"]
+        queue.close()
+    print("Coordinator OK")
+
+if __name__ == "__main__":
+    test_claim_and_stale_takeover()
+    test_listing_page_dedup()
+    test_detail_retries()
+    test_crash_and_resume()
+    test_export()
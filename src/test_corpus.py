@@ -0,0 +1,55 @@
+import subprocess
+import sys
+import numpy as np
+from src.analyzer import Analyzer
+from src.corpus import Corpus, DEFAULT_COLUMNS
+from src.utils import load_json
+
+def test_corpus_round_trip():
+    records = load_json("data/au_2025.json")
+    analyzer = Analyzer("data/au_2025.json")
+
+    # The DataFrame view holds the same values as the raw records
+    df = analyzer.filter_classes()
+    assert list(df.columns) == DEFAULT_COLUMNS
+    assert df.index.tolist() == list(range(len(records)))
+    for row, item in zip(df.itertuples(), records):
+        tags = item.get('tags') if isinstance(item.get('tags'), dict) else {}
+        assert row.url == item.get('url', "") and row.title == item.get('title', "")
+        assert row.summary == (item.get('summary') or "")
+        assert row.key_learnings == item.get('key_learnings', [])
+        assert (row.topics, row.industries, row.products) == \
+               (tags.get('topics', []), tags.get('industries', []), tags.get('products', []))
+
+    # Filtered frames keep corpus row numbers as their index
+    filtered_df = analyzer.filter_classes(["Software Development"])
+    assert all("Software Development" in t for t in filtered_df['topics'])
+    assert analyzer.corpus.to_frame(filtered_df.index, ['title'])['title'].tolist() == filtered_df['title'].tolist()
+
+def test_gather_edge_cases():
+    corpus = Corpus([
+        {'title': "A", 'tags': {'topics': ["AI", "BIM"]}},
+        {'title': "No tags", 'error': "timeout"},
+        {'title': "B", 'tags': {'topics': ["BIM"]}},
+    ])
+    topics = corpus.facets['topics']
+    assert topics.gather([]).tolist() == []
+    assert topics.gather([1]).tolist() == []
+    assert [topics.vocab[t] for t in topics.gather([2, 1, 0])] == ["BIM", "AI", "BIM"]
+    assert topics.owners().tolist() == [0, 0, 2]
+    assert topics.take([1, 2]) == [[], ["BIM"]]
+    assert corpus.to_frame(np.array([1]))['topics'].tolist() == [[]]
+    print("Corpus OK")
+
+def test_analysis_without_pandas():
+    # Filtering and trend counting never materialize a DataFrame, so pandas stays unloaded
+    code = ("import sys; from src.analyzer import Analyzer; a = Analyzer('data/au_2025.json'); "
+            "rows = a.filter_rows(['Software Development']); a.facet_counts(); a.summarize_trends(rows); "
+            "a.get_key_themes(rows); print('pandas' in sys.modules)")
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert out.strip() == "False"
+
+if __name__ == "__main__":
+    test_corpus_round_trip()
+    test_gather_edge_cases()
+    test_analysis_without_pandas()
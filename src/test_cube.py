@@ -0,0 +1,31 @@
+import json
+import os
+import tempfile
+from src.analyzer import Analyzer
+from src.cube import build_cube, save_cube, load_cube, lookup, render_reports
+
+def test_cube_matches_analyzer():
+    analyzer = Analyzer("data/au_2025.json")
+    cube = build_cube(analyzer, "data/au_2025.json", max_pairs=10)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "cube.json.gz")
+        save_cube(cube, path)
+        cube = load_cube(path, "data/au_2025.json")
+        assert cube is not None
+        assert render_reports(cube, os.path.join(tmp, "reports")) == len(cube['slices'])
+
+    for selection in [((), (), ()), (("Software Development",), (), ()), ((), ("Architecture",), ())]:
+        cached = lookup(cube, *selection)
+        rows = analyzer.filter_rows(*selection)
+        assert cached['classes'] == len(rows)
+        expected = json.loads(json.dumps(analyzer.summarize_trends(rows)))
+        assert all(cached[key] == expected[key] for key in expected)
+        assert cached['themes'] == analyzer.get_key_themes(rows)
+
+    # Multi-value selections are not precomputed
+    assert lookup(cube, ("Software Development", "Automation"), (), ()) is None
+    print("Cube OK")
+
+if __name__ == "__main__":
+    test_cube_matches_analyzer()
@@ -0,0 +1,55 @@
+import os
+import tempfile
+from src.analyzer import Analyzer
+from src.corpus import TAG_FACETS
+from src.utils import save_json
+
+def check_counts(analyzer, selection):
+    counts = analyzer.facet_counts(*selection)
+    for i, facet in enumerate(TAG_FACETS):
+        # Each value counts the classes matching it alone, given the other facets' selections
+        for value in analyzer.corpus.facets[facet].vocab:
+            trial = list(selection)
+            trial[i] = [value]
+            assert counts[facet][value] == len(analyzer.filter_rows(*trial)), (selection, facet, value)
+
+def test_facet_counts():
+    analyzer = Analyzer("data/au_2025.json")
+    topics = analyzer.get_all_topics()
+    industries = analyzer.get_all_industries()
+    for selection in [
+        (None, None, None),
+        ([topics[0]], None, None),
+        (None, [industries[0], industries[-1]], None),
+        ([topics[0]], None, [analyzer.get_all_products()[0]]),
+        ([topics[1], topics[2]], [industries[1]], None),
+    ]:
+        check_counts(analyzer, selection)
+
+def test_facet_counts_padding():
+    # 70 rows: the second 64-bit word is only partly used
+    records = [{'title': f"Class {i}", 'tags': {'topics': ["AI"] if i % 3 else ["BIM"],
+                                                'industries': ["AEC"] if i >= 60 else []}}
+               for i in range(70)]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "classes.json")
+        save_json(records, path)
+        analyzer = Analyzer(path)
+    assert analyzer.corpus.facets['topics'].bitsets().shape == (2, 2)
+    counts = analyzer.facet_counts()
+    assert counts['topics'] == {"AI": 46, "BIM": 24}
+    assert counts['industries'] == {"AEC": 10}
+    assert counts['products'] == {}
+    check_counts(analyzer, (None, ["AEC"], None))
+    check_counts(analyzer, (["BIM"], ["AEC"], None))
+
+def test_facet_counts_empty():
+    analyzer = Analyzer("data/missing.json")
+    assert analyzer.corpus.empty
+    assert analyzer.facet_counts(["AI"]) == {facet: {} for facet in TAG_FACETS}
+    print("Facet counts OK")
+
+if __name__ == "__main__":
+    test_facet_counts()
+    test_facet_counts_padding()
+    test_facet_counts_empty()
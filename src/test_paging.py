@@ -0,0 +1,37 @@
+from src.analyzer import Analyzer
+
+def test_page_classes():
+    analyzer = Analyzer("data/au_2025.json")
+    corpus = analyzer.corpus
+    rows = analyzer.filter_rows(["Software Development"])
+    titles = [corpus.titles[r] for r in rows]
+
+    # Title sort is case-insensitive in both directions, across pages
+    for ascending in (True, False):
+        pages = [analyzer.page_classes(rows, page, 7, ['title'], sort_by='title', ascending=ascending)
+                 for page in range(1, -(-len(rows) // 7) + 1)]
+        paged = [t for page_df in pages for t in page_df['title']]
+        expected = sorted(titles, key=str.casefold)
+        assert paged == (expected if ascending else expected[::-1])
+
+    # Default order keeps corpus order and the frame index holds row numbers
+    page_df = analyzer.page_classes(rows, 2, 5, ['title'])
+    assert page_df.index.tolist() == rows[5:10].tolist()
+
+    # Long summaries are cut with an ellipsis, short ones are left alone
+    page_df = analyzer.page_classes(rows, 1, len(rows), ['summary'], summary_chars=40)
+    for r, summary in zip(rows, page_df['summary']):
+        full = corpus.summaries[r]
+        if len(full) <= 40:
+            assert summary == full
+        else:
+            assert summary.endswith("…") and full.startswith(summary[:-1]) and len(summary) <= 41
+    assert any(s.endswith("…") for s in page_df['summary'])
+
+    # Past the last page
+    page_df = analyzer.page_classes(rows, -(-len(rows) // 7) + 1, 7, ['title', 'url'])
+    assert page_df.empty and list(page_df.columns) == ['title', 'url']
+    print("Paging OK")
+
+if __name__ == "__main__":
+    test_page_classes()
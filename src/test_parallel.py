@@ -0,0 +1,34 @@
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from src.analyzer import Analyzer
+
+def test_parallel_matches_serial():
+    serial = Analyzer("data/au_2025.json", parallel=False)
+    parallel = Analyzer("data/au_2025.json", parallel=True, workers=2)
+    try:
+        for selection in [None, ["Software Development"]]:
+            filtered_df = serial.filter_classes(selection)
+            assert parallel.summarize_trends(filtered_df) == serial.summarize_trends(filtered_df)
+            assert parallel.get_key_themes(filtered_df) == serial.get_key_themes(filtered_df)
+            assert list(parallel.get_topic_intersections(filtered_df).items()) == \
+                   list(serial.get_topic_intersections(filtered_df).items())
+    finally:
+        parallel.close()
+    print("Parallel results match serial")
+
+def test_runner_shared_across_threads():
+    # Sessions sharing one cached Analyzer must not each start a pool
+    analyzer = Analyzer("data/au_2025.json", parallel=True, workers=1)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            runners = list(executor.map(lambda _: analyzer._parallel(), range(8)))
+        assert all(runner is runners[0] for runner in runners)
+        copy = pickle.loads(pickle.dumps(analyzer))
+        assert copy._runner is None and copy.summarize_trends() == analyzer.summarize_trends()
+        copy.close()
+    finally:
+        analyzer.close()
+
+if __name__ == "__main__":
+    test_parallel_matches_serial()
+    test_runner_shared_across_threads()
@@ -0,0 +1,69 @@
+import asyncio
+import numpy as np
+from src import service as service_module
+from src.analyzer import Analyzer
+from src.service import QueryService, LocalClient
+
+def test_service():
+    service = QueryService("data/au_2025.json", workers=0)
+    client = LocalClient(service)
+    analyzer = Analyzer("data/au_2025.json")
+
+    async def run():
+        status, health = await client.get("/health")
+        assert status == 200 and health['classes'] == len(analyzer.corpus)
+
+        status, trends = await client.get("/trends?topics=Software+Development")
+        filtered_df = analyzer.filter_classes(["Software Development"])
+        expected = analyzer.summarize_trends(filtered_df)
+        assert status == 200
+        assert trends['top_topics'] == [list(t) for t in expected['top_topics']]
+
+        status, page = await client.get("/filter?topics=Software+Development&limit=5")
+        assert page['count'] == len(filtered_df) and len(page['classes']) == 5
+
+        status, error = await client.get("/filter?offset=-5")
+        assert status == 400 and 'negative' in error['error']
+
+        # Identical concurrent queries share one computation
+        before = service.stats['computed']
+        results = await asyncio.gather(*(client.get("/themes") for _ in range(10)))
+        assert service.stats['computed'] == before + 1
+        assert all(r == results[0] for r in results)
+
+        status, _ = await client.get("/nope")
+        assert status == 404
+
+    try:
+        asyncio.run(run())
+    finally:
+        service.close()
+    print("Service OK")
+
+def test_service_pool_loads_corpus_in_workers_only():
+    service = QueryService("data/au_2025.json", workers=1)
+    client = LocalClient(service)
+    assert service.analyzer is None
+
+    async def run():
+        status, health = await client.get("/health")
+        assert status == 200 and health['classes'] == len(Analyzer("data/au_2025.json").corpus)
+        status, page = await client.get("/filter?limit=3")
+        assert status == 200 and len(page['classes']) == 3
+
+    try:
+        asyncio.run(run())
+    finally:
+        service.close()
+
+def test_service_worker_stays_serial():
+    service_module._init_worker("data/au_2025.json")
+    analyzer = service_module._worker_analyzer
+    service_module.run_query('trends', {})
+    assert not analyzer._use_parallel(np.arange(10 ** 6))
+    assert analyzer._runner is None
+
+if __name__ == "__main__":
+    test_service()
+    test_service_pool_loads_corpus_in_workers_only()
+    test_service_worker_stays_serial()
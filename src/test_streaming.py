@@ -0,0 +1,72 @@
+import json
+import os
+import tempfile
+import tracemalloc
+from src.analyzer import Analyzer
+from src.streaming import StreamingTrends, iter_records, exact_counts, check_against_exact
+from src.utils import load_json
+
+def test_streaming_bounds():
+    records = list(iter_records("data/au_2025.json", chunk_size=1024))
+    assert records == load_json("data/au_2025.json")
+
+    # Exact counts over the stream agree with the in-memory Analyzer
+    exact = exact_counts(records)
+    trends = Analyzer("data/au_2025.json").summarize_trends()
+    assert exact['top_topics'].most_common(15) == trends['top_topics']
+    assert exact['top_phrases'].most_common(15) == trends['top_phrases']
+
+    # A small sketch stays within its error bounds and keeps every heavy hitter
+    stream = StreamingTrends(capacity=1000).consume(records)
+    report = check_against_exact(stream, exact)
+    for name, r in report.items():
+        assert r['max_observed_error'] <= r['max_error_bound'], name
+        assert r['heavy_hitters_tracked'], name
+
+    # Topics fit in the sketch, so they are exact
+    assert stream.summarize()['top_topics'] == trends['top_topics']
+    print("Streaming OK")
+
+def test_iter_records_chunk_boundaries():
+    # Every chunk size cuts literals, numbers, escapes and strings somewhere
+    records = [{'title': "Caf\u00e9 \"AI\"", 'ok': True, 'tags': None, 'n': -12.5e3, 'x': float('-inf')},
+               {'title': "\u65e5\u672c\u8a9e", 'ok': False, 'list': [1, [2, {}], "]"]}]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "classes.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(records, indent=1))
+        for chunk_size in range(1, 64):
+            assert list(iter_records(path, chunk_size=chunk_size)) == records, chunk_size
+
+def test_iter_records_malformed_input():
+    with tempfile.TemporaryDirectory() as tmp:
+        # A bad record near the start raises without reading the rest of the file
+        path = os.path.join(tmp, "bad.json")
+        record = json.dumps({'title': "x" * 1000, 'summary': "y" * 1000})
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('[{"title": bad}, ' + ", ".join([record] * 5000) + "]")
+        tracemalloc.start()
+        try:
+            list(iter_records(path, chunk_size=4096))
+            raise AssertionError("malformed record was accepted")
+        except json.JSONDecodeError as e:
+            assert e.pos == 10
+        finally:
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        assert peak < 1 << 20, peak
+
+        # An unterminated string cannot grow the buffer past max_record_size
+        path = os.path.join(tmp, "open_string.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('[{"title": "' + "x" * 100000)
+        try:
+            list(iter_records(path, chunk_size=4096, max_record_size=10000))
+            raise AssertionError("oversized record was accepted")
+        except ValueError as e:
+            assert "longer than 10000" in str(e)
+
+if __name__ == "__main__":
+    test_streaming_bounds()
+    test_iter_records_chunk_boundaries()
+    test_iter_records_malformed_input()